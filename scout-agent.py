@@ -6,8 +6,13 @@ project -13
 v1.987 -
 """
 
+import time
+_PROCESS_START = time.perf_counter()  # startup regressions, see STARTUP_TIMES
+
 import warnings
 import logging
+import importlib
+import importlib.util
 import argparse
 from datetime import datetime
 import requests
@@ -16,11 +21,38 @@ import re
 import os
 import sys
 import json
+import atexit
 from urllib.parse import urlparse, quote, unquote, parse_qs
-import time
 import base64
+import copy
+import hashlib
+import sqlite3
+import zlib
+import math
+from collections import namedtuple
+import html
+import io
+import shutil
+import tempfile
+from collections import deque, Counter, OrderedDict
+from xml.etree import ElementTree
 import random
+import signal
+import multiprocessing
+import threading
+import queue
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+import socket
+try:
+    import resource  # unix only, used for per-page cpu limits
+except ImportError:
+    resource = None
 import urllib3
+import urllib3.util.connection
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Kill the *FISHING noise
@@ -29,52 +61,384 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 for logger_name in ['transformers', 'torch', 'tensorflow', 'urllib3', 'requests']:
     logging.getLogger(logger_name).setLevel(logging.CRITICAL)
 
+STARTUP_TIMES = {}  # name -> seconds, module import first then lazy loads as they happen
+
 # Optional dependencies - okay this is getting ridiculous
-try:
-    import trafilatura
-    TRAFILATURA_AVAILABLE = True
-except ImportError:
-    TRAFILATURA_AVAILABLE = False
-    print("[note] trafilatura not found, using BS4 + hacks")
+# only *look* for them here, the actual import happens the first time they're needed
+def _has_module(name):
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
-try:
-    from readability import Document
-    READABILITY_AVAILABLE = True
-except ImportError:
-    READABILITY_AVAILABLE = False
+TRAFILATURA_AVAILABLE = _has_module('trafilatura')
+if not TRAFILATURA_AVAILABLE and multiprocessing.parent_process() is None:  # not again in every worker
+    print("[note] trafilatura not found, using BS4 + hacks")
+READABILITY_AVAILABLE = _has_module('readability')
+NEWSPAPER_AVAILABLE = _has_module('newspaper')
+MARKDOWNIFY_AVAILABLE = _has_module('markdownify')
+TRANSFORMERS_AVAILABLE = _has_module('transformers')
 
-try:
-    import newspaper
-    NEWSPAPER_AVAILABLE = True
-except ImportError:
-    NEWSPAPER_AVAILABLE = False
+_LAZY_MODULES = {}
+_LAZY_LOCK = threading.Lock()
 
-try:
-    from markdownify import markdownify
-    MARKDOWNIFY_AVAILABLE = True
-except ImportError:
-    MARKDOWNIFY_AVAILABLE = False
+def lazy_import(name):
+    """Import a heavy optional module on first use, None if it's not there"""
+    if name in _LAZY_MODULES:
+        return _LAZY_MODULES[name]
+    with _LAZY_LOCK:
+        if name not in _LAZY_MODULES:
+            started = time.perf_counter()
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    _LAZY_MODULES[name] = importlib.import_module(name)
+            except Exception as e:
+                print(f"[warn] {name} import failed: {e}")
+                _LAZY_MODULES[name] = None
+            STARTUP_TIMES[f'import {name}'] = time.perf_counter() - started
+    return _LAZY_MODULES[name]
 
-# bumble bee!!!
+# bumble bee!!! (built lazily by get_summarizer, not at import time anymore)
+SUMMARIZER_MODELS = {
+    'bart': ['facebook/bart-large-cnn', 'sshleifer/distilbart-cnn-12-6'],  # try big one, then smaller
+    'distilbart': ['sshleifer/distilbart-cnn-12-6'],
+    'extractive': [],
+    'none': []
+}
+SUMMARIZER_MODE = 'bart'
+# how the model runs on cpu: eager fp32 torch, dynamic int8 torch, or an exported onnx runtime graph
+SUMMARIZER_BACKENDS = ['torch', 'int8', 'onnx']
+SUMMARIZER_BACKEND = 'torch'
+INFERENCE_THREADS = None  # intra-op threads, None = library default (all cores)
+INTEROP_THREADS = None  # inter-op threads
+ONNX_EXPORT_DIR = 'onnx'  # under CACHE_DIR, one folder per model
 SUMMARIZER = None
-try:
-    from transformers import pipeline
-    import transformers
-    transformers.logging.set_verbosity_error()
+SUMMARIZER_MODEL_NAME = None
+_SUMMARIZER_LOADED = False
+_SUMMARIZER_LOAD_LOCK = threading.Lock()
+
+def set_summarizer_mode(mode, backend=None):
+    """Pick bart/distilbart/extractive/none (and torch/int8/onnx) - resets any loaded model"""
+    global SUMMARIZER_MODE, SUMMARIZER_BACKEND, SUMMARIZER, SUMMARIZER_MODEL_NAME, _SUMMARIZER_LOADED
+    if mode not in SUMMARIZER_MODELS:
+        raise ValueError(f"unknown summarizer {mode!r}, pick one of {', '.join(SUMMARIZER_MODELS)}")
+    if backend is not None and backend not in SUMMARIZER_BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}, pick one of {', '.join(SUMMARIZER_BACKENDS)}")
+    with _SUMMARIZER_LOAD_LOCK:
+        SUMMARIZER_MODE = mode
+        SUMMARIZER_BACKEND = backend or SUMMARIZER_BACKEND
+        SUMMARIZER = None
+        SUMMARIZER_MODEL_NAME = None
+        _SUMMARIZER_LOADED = False
+
+def set_inference_threads(threads=None, interop_threads=None):
+    """Thread counts for the next model load (torch ones apply right away if torch is already in)"""
+    global INFERENCE_THREADS, INTEROP_THREADS
+    INFERENCE_THREADS, INTEROP_THREADS = threads, interop_threads
+    if 'torch' in sys.modules:
+        _apply_torch_threads(sys.modules['torch'])
+
+def _apply_torch_threads(torch):
+    if INFERENCE_THREADS:
+        torch.set_num_threads(INFERENCE_THREADS)
+    if INTEROP_THREADS:
+        try:
+            torch.set_num_interop_threads(INTEROP_THREADS)
+        except RuntimeError:
+            pass  # only allowed before the first parallel op, too late now
+
+def _backend_name(model_name, backend):
+    """Quantized / onnx output isn't byte-identical to fp32, so it's a different model for the cache"""
+    return model_name if backend == 'torch' else f"{model_name}@{backend}"
+
+def build_summarizer(transformers, model_name, backend):
+    """One summarization pipeline for model_name on the given backend (raises if it can't)"""
+    if backend == 'torch':
+        torch = lazy_import('torch')
+        if torch is not None:
+            _apply_torch_threads(torch)
+        return transformers.pipeline("summarization", model=model_name)
+    
+    tokenizer = transformers.AutoTokenizer.from_pretrained(model_name)
+    if backend == 'int8':
+        torch = lazy_import('torch')
+        if torch is None:
+            raise RuntimeError("int8 backend needs torch")
+        _apply_torch_threads(torch)
+        model = transformers.AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        model.eval()
+        # dynamic quantization: Linear weights to int8 once, activations quantized on the fly
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return transformers.pipeline("summarization", model=model, tokenizer=tokenizer)
+    
+    # onnx: export once into the cache dir, later runs just load the graph
+    ort = lazy_import('onnxruntime')
+    optimum_ort = lazy_import('optimum.onnxruntime')
+    if ort is None or optimum_ort is None:
+        raise RuntimeError("onnx backend needs onnxruntime and optimum[onnxruntime]")
+    options = ort.SessionOptions()
+    if INFERENCE_THREADS:
+        options.intra_op_num_threads = INFERENCE_THREADS
+    if INTEROP_THREADS:
+        options.inter_op_num_threads = INTEROP_THREADS
+    export_dir = os.path.join(CACHE_DIR, ONNX_EXPORT_DIR, re.sub(r'[^\w.-]+', '_', model_name))
+    if os.path.exists(os.path.join(export_dir, 'config.json')):
+        model = optimum_ort.ORTModelForSeq2SeqLM.from_pretrained(export_dir, session_options=options)
+    else:
+        started = time.perf_counter()
+        model = optimum_ort.ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True, session_options=options)
+        os.makedirs(export_dir, exist_ok=True)
+        model.save_pretrained(export_dir)
+        tokenizer.save_pretrained(export_dir)
+        print(f"[model] exported {model_name} to onnx in {time.perf_counter() - started:.1f}s ({export_dir})")
+    return transformers.pipeline("summarization", model=model, tokenizer=tokenizer)
+
+def get_summarizer():
+    """Build the transformers pipeline the first time a summary is needed"""
+    global SUMMARIZER, SUMMARIZER_MODEL_NAME, _SUMMARIZER_LOADED
+    if _SUMMARIZER_LOADED:
+        return SUMMARIZER
     
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        # try smaller model first
+    with _SUMMARIZER_LOAD_LOCK:
+        if _SUMMARIZER_LOADED:
+            return SUMMARIZER
+        
+        models = SUMMARIZER_MODELS[SUMMARIZER_MODE]
+        if models and TRANSFORMERS_AVAILABLE:
+            started = time.perf_counter()
+            transformers = lazy_import('transformers')
+            if transformers is not None:
+                quiet_model_logs(transformers)
+                # asked-for backend first, plain torch if that one can't be had
+                backends = [SUMMARIZER_BACKEND] + (['torch'] if SUMMARIZER_BACKEND != 'torch' else [])
+                for model_name in models:
+                    for backend in backends:
+                        try:
+                            with warnings.catch_warnings():
+                                warnings.simplefilter("ignore")
+                                SUMMARIZER = build_summarizer(transformers, model_name, backend)
+                            SUMMARIZER_MODEL_NAME = _backend_name(model_name, backend)
+                            break
+                        except Exception as e:
+                            print(f"[warn] summarizer {model_name} ({backend}) failed: {e}")
+                    if SUMMARIZER is not None:
+                        break
+            STARTUP_TIMES['model load'] = time.perf_counter() - started
+            if SUMMARIZER is not None:
+                print(f"[model] {SUMMARIZER_MODEL_NAME} ready in {STARTUP_TIMES['model load']:.1f}s")
+        
+        _SUMMARIZER_LOADED = True
+    return SUMMARIZER
+
+@contextmanager
+def inference_context():
+    """torch.inference_mode around model calls when torch is what's running them"""
+    torch = sys.modules.get('torch')
+    if torch is None or not hasattr(torch, 'inference_mode'):
+        yield
+        return
+    with torch.inference_mode():
+        yield
+
+def summarizer_model_name():
+    """What summaries come from right now - used in summary cache keys"""
+    if SUMMARIZER_MODE == 'none':
+        return 'none'
+    if _SUMMARIZER_LOADED:
+        return SUMMARIZER_MODEL_NAME or 'extractive'
+    models = SUMMARIZER_MODELS[SUMMARIZER_MODE]
+    return _backend_name(models[0], SUMMARIZER_BACKEND) if models and TRANSFORMERS_AVAILABLE else 'extractive'
+
+def format_startup_times():
+    return ', '.join(f"{name} {secs:.2f}s" for name, secs in STARTUP_TIMES.items())
+
+class Tracer:
+    """
+    Spans around stages and urls for --metrics / --profile. Off by default, and then
+    a span is just a throwaway dict. Spans nest per thread (begin/end on a stack).
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self.spans = []
+        self.started = time.perf_counter()
+        self.wall_started = time.time()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._next_id = 0
+    
+    def enable(self):
+        self.enabled = True
+        self.spans = []
+        self.started = time.perf_counter()
+        self.wall_started = time.time()
+    
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+    
+    def _new(self, name, attrs, start):
+        with self._lock:
+            self._next_id += 1
+            span_id = self._next_id
+        stack = self._stack()
+        span = {'id': span_id, 'parent': stack[-1]['id'] if stack else None, 'name': name,
+                'thread': threading.current_thread().name, 'start_ms': round((start - self.started) * 1000, 3)}
+        span.update(attrs)
+        return span
+    
+    def begin(self, name, **attrs):
+        if not self.enabled:
+            return attrs
+        span = self._new(name, attrs, time.perf_counter())
+        span['_t'] = (time.perf_counter(), time.thread_time())
+        self._stack().append(span)
+        return span
+    
+    def end(self, span):
+        if not self.enabled or '_t' not in span:
+            return
+        wall, cpu = span.pop('_t')
+        span['wall_ms'] = round((time.perf_counter() - wall) * 1000, 3)
+        span['cpu_ms'] = round((time.thread_time() - cpu) * 1000, 3)
+        stack = self._stack()
+        if span in stack:
+            stack.remove(span)
+        with self._lock:
+            self.spans.append(span)
+    
+    @contextmanager
+    def span(self, name, **attrs):
+        span = self.begin(name, **attrs)
         try:
-            SUMMARIZER = pipeline("summarization", model="facebook/bart-large-cnn")
-        except:
-            try:
-                SUMMARIZER = pipeline("summarization", model="sshleifer/distilbart-cnn-12-6")
-            except Exception as e:
-                print(f"[warn] summarizer failed: {e}")
-                SUMMARIZER = None
-except Exception as e:
-    print(f"[warn] transformers import failed: {e}")
+            yield span
+        except BaseException as e:
+            span['error'] = type(e).__name__
+            raise
+        finally:
+            self.end(span)
+    
+    def record(self, name, wall_seconds, cpu_seconds=None, **attrs):
+        """A span for something already timed (e.g. in a worker process), child of the current one"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        span = self._new(name, attrs, now - wall_seconds)
+        span['wall_ms'] = round(wall_seconds * 1000, 3)
+        if cpu_seconds is not None:
+            span['cpu_ms'] = round(cpu_seconds * 1000, 3)
+        with self._lock:
+            self.spans.append(span)
+    
+    def annotate(self, **attrs):
+        """Add to the innermost open span in this thread"""
+        if self.enabled:
+            stack = self._stack()
+            if stack:
+                stack[-1].update(attrs)
+    
+    def hot_spots(self, top=10):
+        """Where the time went: per span name (total / self / cpu / percentiles) and the slowest urls"""
+        with self._lock:
+            spans = list(self.spans)
+        children = {}
+        for s in spans:
+            if s['parent'] is not None:
+                children[s['parent']] = children.get(s['parent'], 0.0) + s.get('wall_ms', 0.0)
+        by_name = {}
+        for s in spans:
+            by_name.setdefault(s['name'], []).append(s)
+        names = []
+        for name, group in by_name.items():
+            walls = sorted(s.get('wall_ms', 0.0) for s in group)
+            names.append({
+                'name': name,
+                'count': len(group),
+                'total_ms': round(sum(walls), 1),
+                'self_ms': round(sum(max(0.0, s.get('wall_ms', 0.0) - children.get(s['id'], 0.0)) for s in group), 1),
+                'cpu_ms': round(sum(s.get('cpu_ms', 0.0) for s in group), 1),
+                'p50_ms': round(walls[len(walls) // 2], 1),
+                'p95_ms': round(walls[min(len(walls) - 1, int(len(walls) * 0.95))], 1),
+                'max_ms': round(walls[-1], 1),
+            })
+        names.sort(key=lambda n: -n['self_ms'])
+        urls = sorted((s for s in spans if s['name'] in ('article', 'fetch', 'extract') and s.get('url')),
+                      key=lambda s: -s.get('wall_ms', 0.0))
+        return {'by_name': names[:top],
+                'slowest_urls': [{k: s.get(k) for k in ('name', 'url', 'wall_ms', 'cpu_ms', 'cache', 'winner', 'status')}
+                                 for s in urls[:top]]}
+    
+    def export(self, path):
+        """path.jsonl -> one span per line, anything else -> one json document with a hot spot summary"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s['start_ms'])
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith('.jsonl'):
+                for span in spans:
+                    f.write(json.dumps(span, default=str) + '\n')
+            else:
+                json.dump({
+                    'started': datetime.fromtimestamp(self.wall_started).isoformat(timespec='seconds'),
+                    'wall_s': round(time.perf_counter() - self.started, 3),
+                    'startup': {k: round(v, 3) for k, v in STARTUP_TIMES.items()},
+                    'hot_spots': self.hot_spots(),
+                    'spans': spans,
+                }, f, indent=1, default=str)
+
+def format_profile(hot):
+    lines = [f"  {'span':20s} {'count':>6s} {'self ms':>10s} {'total ms':>10s} {'cpu ms':>9s} {'p50':>8s} {'p95':>8s} {'max':>8s}"]
+    for n in hot['by_name']:
+        lines.append(f"  {n['name'][:20]:20s} {n['count']:6d} {n['self_ms']:10.1f} {n['total_ms']:10.1f} {n['cpu_ms']:9.1f} "
+                     f"{n['p50_ms']:8.1f} {n['p95_ms']:8.1f} {n['max_ms']:8.1f}")
+    if hot['slowest_urls']:
+        lines.append("  slowest urls:")
+        for s in hot['slowest_urls']:
+            extra = ', '.join(f"{k} {s[k]}" for k in ('cache', 'winner', 'status') if s.get(k) is not None)
+            lines.append(f"  {s['wall_ms']:9.1f}ms {s['name']:8s} {s['url'][:80]}{'  (' + extra + ')' if extra else ''}")
+    return '\n'.join(lines)
+
+TRACER = Tracer()
+
+class ResultStream:
+    """
+    --jsonl: one json line per article the moment it's summarized, then one per topic
+    with the overview and leads. Appends, flushes every line, safe across threads.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        if path == '-':
+            self._file = sys.stdout
+        else:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            self._file = open(path, 'a', encoding='utf-8')
+        self.lines = 0
+    
+    def write(self, kind, **fields):
+        line = json.dumps(dict(type=kind, time=datetime.now().isoformat(timespec='seconds'), **fields),
+                          ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.lines += 1
+    
+    def close(self):
+        with self._lock:
+            if self._file is not sys.stdout:
+                self._file.close()
+
+RESULT_STREAM = None
+STREAM_EXCERPT_SENTENCES = 6  # what's kept of a streamed article's body for the extractive overview
+
+def set_result_stream(stream):
+    global RESULT_STREAM
+    old, RESULT_STREAM = RESULT_STREAM, stream
+    return old
 
 # the config to be nice with servers  ;)
 USER_AGENTS = [
@@ -92,7 +456,44 @@ USER_AGENTS = [
 REQUEST_TIMEOUT = 20  # upped from 15, some sites are slooow
 MAX_ARTICLE_LENGTH = 8000
 CACHE_DIR = '.scout_cache_v2'
+CACHE_BACKEND = 'sqlite'  # see CACHE_BACKENDS
+CACHE_DB_NAME = 'cache.sqlite3'
+CACHE_MAX_BYTES = 256 * 1024 * 1024  # least recently used entries go first past this
+CACHE_COMPRESS_MIN = 1024  # zlib anything bigger
+CACHE_EVICT_CHECK_EVERY = 50  # writes between size checks
+CACHE_ACCESS_RESOLUTION = 300  # seconds - a hit only rewrites last_access when it's older than this, LRU doesn't need better
+EXTRACTION_TIMEOUT = 20  # wall clock seconds per page in the process pool
+EXTRACTION_CPU_LIMIT = 15  # cpu seconds per page, RLIMIT_CPU kills the worker past it
+ADAPTIVE_EXTRACTORS = True  # learn per-domain extractor order from past runs
+EXTRACTOR_SKIP_AFTER = 5  # tries with zero wins before an extractor is skipped on a domain
+EXTRACTOR_RETRY_RATE = 0.1  # ...but still give it a go this often, sites change
+EXTRACTOR_STATS_FLUSH_EVERY = 25  # pages between writes of the per-domain stats (and at the end of a run)
+TEXT_CACHE_TTL = 86400  # 24 hours, after that we revalidate with ETag/Last-Modified
+RAW_CACHE_TTL = 14 * 86400  # raw html outlives the text, re-extraction needs it
+RAW_CACHE_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Date', 'Content-Language')
+CACHE_STALE_KEEP = 7 * 86400  # expired entries kept this long for revalidation
+RSS_CACHE_TTL = 0  # feed body kept only for conditional requests, always revalidated
 RATE_LIMIT_DELAY = random.uniform(1.5, 2.5)  # randomize delay
+DEFAULT_WORKERS = 1  # >1 fetches concurrently
+DEFAULT_QUEUE_DEPTH = 8  # pipeline mode, items buffered between stages
+DEFAULT_STAGE_WORKERS = {'fetch': 4, 'extract': 2, 'summarize': 1}
+MAX_SUMMARIES = 10  # Limit to 10 for speed
+SUMMARY_BATCH_SIZE = 4  # texts per model call, padded together
+SUMMARY_CHUNKING = True  # long texts: summarize chunks, then the summaries (instead of truncating)
+SUMMARY_CHUNK_TOKENS = 900  # model tokens per chunk, under bart's 1024 with room for special tokens
+SUMMARY_REDUCE_ROUNDS = 3  # partial summaries that still don't fit get chunked again, this many times max
+TOKEN_CACHE_DOCS = 256  # documents whose sentence token counts are kept
+HTTP_POOL_SIZE = 10  # keep-alive connections kept per host
+HTTP_POOL_HOSTS = 32  # hosts with a live pool at once
+HOST_POOL_SIZES = {'news.google.com': 16}  # busier hosts get bigger pools
+DNS_CACHE_TTL = 300
+DECODE_CACHE_TTL = 30 * 86400  # google news ids don't change target
+DECODE_WORKERS = 8  # Google News links resolved at once
+SUMMARY_CACHE_TTL = 7 * 86400  # summaries of unchanged text don't go stale fast
+SUMMARY_CACHE_ENABLED = True
+SUMMARIZER_VERSION = 3  # bump when summary logic changes, old cache entries stop matching
+TOPIC_STATE_TTL = 30 * 86400  # --incremental: what a topic's last run saw, kept this long
+INCREMENTAL_RECHECK = TEXT_CACHE_TTL  # known articles aren't refetched until their text is this old
 
 # Domains that ALWAYS fail - skip them
 BLACKLIST_DOMAINS = {
@@ -110,41 +511,739 @@ SPECIAL_SITES = {
     'linkedin.com': 'linkedin_handler'  # double lol
 }
 
+CacheEntry = namedtuple('CacheEntry', ['value', 'meta', 'created', 'expires'])
+FetchResult = namedtuple('FetchResult', ['html', 'status', 'headers', 'url'])
+
+class CacheStore:
+    """
+    Where cached things live. Everything is (namespace, key) -> value with a
+    per-entry TTL and a small json meta dict. Subclass this for another backend.
+    """
+    
+    def get(self, namespace, key, include_expired=False):
+        """CacheEntry or None. Expired entries only come back with include_expired"""
+        return None
+    
+    def put(self, namespace, key, value, ttl=None, meta=None):
+        pass
+    
+    def touch(self, namespace, key, ttl=None):
+        """Restart an entry's TTL without rewriting the value"""
+        pass
+    
+    def items(self, namespace):
+        """(key, CacheEntry) for every unexpired entry in a namespace"""
+        return iter(())
+    
+    def delete(self, namespace, key):
+        pass
+    
+    def prune(self, max_bytes=None):
+        """Drop long-expired entries then LRU ones over the size cap, returns how many went"""
+        return 0
+    
+    def stats(self):
+        return {'backend': type(self).__name__, 'entries': 0, 'bytes': 0, 'namespaces': {}}
+    
+    def release_threads(self):
+        """Let go of anything held for threads that have exited (a worker pool shut down)"""
+        pass
+    
+    def close(self):
+        pass
+
+class NullCacheStore(CacheStore):
+    """--nocache: remembers nothing"""
+
+class SqliteCacheStore(CacheStore):
+    """
+    One sqlite file with an index instead of a file per url. WAL mode + busy
+    timeout so worker threads and several processes can share it. Values over
+    CACHE_COMPRESS_MIN bytes are zlib compressed, total size is capped with LRU eviction.
+    """
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            namespace TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value BLOB,
+            flags INTEGER NOT NULL DEFAULT 0,
+            size INTEGER NOT NULL DEFAULT 0,
+            meta TEXT,
+            created REAL NOT NULL,
+            expires REAL,
+            last_access REAL NOT NULL,
+            PRIMARY KEY (namespace, key)
+        );
+        CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access);
+        CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires);
+    """
+    _COMPRESSED = 1
+    _TEXT = 2
+    
+    def __init__(self, path=None, max_bytes=None, compress=True):
+        self.path = path or os.path.join(CACHE_DIR, CACHE_DB_NAME)
+        self.max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.compress = compress
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._conns = {}  # thread -> its connection, so pool threads' ones get closed once the pool is gone
+        self._puts = 0
+        self.counters = {'hits': 0, 'misses': 0, 'expired': 0, 'writes': 0, 'evicted': 0}
+    
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self.release_threads()
+            # still one connection per thread, check_same_thread is off only so release_threads can close it
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self._SCHEMA)
+            self._local.conn = conn
+            with self._lock:
+                self._conns[threading.current_thread()] = conn
+        return conn
+    
+    def release_threads(self):
+        with self._lock:
+            dead = [thread for thread in self._conns if not thread.is_alive()]
+            conns = [self._conns.pop(thread) for thread in dead]
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+    
+    def _count(self, name, n=1):
+        with self._lock:
+            self.counters[name] += n
+    
+    def _encode(self, value):
+        flags = 0
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+            flags |= self._TEXT
+        if self.compress and len(value) >= CACHE_COMPRESS_MIN:
+            packed = zlib.compress(value, 6)
+            if len(packed) < len(value):
+                value = packed
+                flags |= self._COMPRESSED
+        return value, flags
+    
+    def _decode(self, value, flags):
+        if flags & self._COMPRESSED:
+            value = zlib.decompress(value)
+        if flags & self._TEXT:
+            value = value.decode('utf-8')
+        return value
+    
+    def get(self, namespace, key, include_expired=False):
+        try:
+            row = self._conn().execute(
+                "SELECT value, flags, meta, created, expires, last_access FROM entries WHERE namespace=? AND key=?",
+                (namespace, key)).fetchone()
+        except sqlite3.Error as e:
+            print(f"[cache error] {e}")
+            return None
+        
+        if row is None:
+            self._count('misses')
+            return None
+        
+        value, flags, meta, created, expires, last_access = row
+        now = time.time()
+        if expires is not None and expires <= now:
+            self._count('expired')
+            if not include_expired:
+                return None
+        else:
+            self._count('hits')
+        
+        try:
+            if now - last_access >= CACHE_ACCESS_RESOLUTION:  # a write (and the write lock) per hit is too much
+                self._conn().execute(
+                    "UPDATE entries SET last_access=? WHERE namespace=? AND key=?", (now, namespace, key))
+            value = self._decode(value, flags)
+            meta = json.loads(meta) if meta else {}
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            print(f"[cache error] {e}")
+            return None
+        return CacheEntry(value, meta, created, expires)
+    
+    def put(self, namespace, key, value, ttl=None, meta=None):
+        blob, flags = self._encode(value)
+        now = time.time()
+        try:
+            self._conn().execute(
+                "INSERT OR REPLACE INTO entries "
+                "(namespace, key, value, flags, size, meta, created, expires, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (namespace, key, blob, flags, len(blob), json.dumps(meta) if meta else None,
+                 now, now + ttl if ttl is not None else None, now))
+        except sqlite3.Error as e:
+            print(f"[cache error] {e}")
+            return
+        
+        self._count('writes')
+        with self._lock:
+            self._puts += 1
+            check = self._puts % CACHE_EVICT_CHECK_EVERY == 0
+        if check:
+            self.prune()
+    
+    def touch(self, namespace, key, ttl=None):
+        now = time.time()
+        try:
+            self._conn().execute(
+                "UPDATE entries SET expires=?, last_access=? WHERE namespace=? AND key=?",
+                (now + ttl if ttl is not None else None, now, namespace, key))
+        except sqlite3.Error as e:
+            print(f"[cache error] {e}")
+    
+    def items(self, namespace):
+        try:
+            rows = self._conn().execute(
+                "SELECT key, value, flags, meta, created, expires FROM entries "
+                "WHERE namespace=? AND (expires IS NULL OR expires > ?) ORDER BY key",
+                (namespace, time.time())).fetchall()
+        except sqlite3.Error as e:
+            print(f"[cache error] {e}")
+            return
+        for key, value, flags, meta, created, expires in rows:
+            yield key, CacheEntry(self._decode(value, flags), json.loads(meta) if meta else {}, created, expires)
+    
+    def delete(self, namespace, key):
+        try:
+            self._conn().execute("DELETE FROM entries WHERE namespace=? AND key=?", (namespace, key))
+        except sqlite3.Error as e:
+            print(f"[cache error] {e}")
+    
+    def prune(self, max_bytes=None):
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        removed = 0
+        try:
+            conn = self._conn()
+            # expired entries hang around CACHE_STALE_KEEP longer, they can still be revalidated
+            removed += conn.execute(
+                "DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?",
+                (time.time() - CACHE_STALE_KEEP,)).rowcount
+            
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > max_bytes:
+                # evict least recently used down to 90% so we don't do this every put
+                target = total - int(max_bytes * 0.9)
+                freed = 0
+                doomed = []
+                for namespace, key, size in conn.execute(
+                        "SELECT namespace, key, size FROM entries ORDER BY last_access"):
+                    doomed.append((namespace, key))
+                    freed += size
+                    if freed >= target:
+                        break
+                conn.executemany("DELETE FROM entries WHERE namespace=? AND key=?", doomed)
+                removed += len(doomed)
+        except sqlite3.Error as e:
+            print(f"[cache error] {e}")
+        
+        self._count('evicted', removed)
+        return removed
+    
+    def stats(self):
+        info = {'backend': 'sqlite', 'path': self.path, 'entries': 0, 'bytes': 0,
+                'expired': 0, 'max_bytes': self.max_bytes, 'namespaces': {}}
+        try:
+            conn = self._conn()
+            now = time.time()
+            for namespace, entries, size, expired in conn.execute(
+                    "SELECT namespace, COUNT(*), COALESCE(SUM(size), 0), "
+                    "SUM(CASE WHEN expires IS NOT NULL AND expires <= ? THEN 1 ELSE 0 END) "
+                    "FROM entries GROUP BY namespace", (now,)):
+                info['namespaces'][namespace] = {'entries': entries, 'bytes': size, 'expired': expired}
+                info['entries'] += entries
+                info['bytes'] += size
+                info['expired'] += expired
+            info['file_bytes'] = sum(
+                os.path.getsize(p) for p in (self.path, self.path + '-wal') if os.path.exists(p))
+        except (sqlite3.Error, OSError) as e:
+            print(f"[cache error] {e}")
+        with self._lock:
+            info.update(self.counters)
+        return info
+    
+    def vacuum(self):
+        try:
+            self._conn().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn().execute("VACUUM")
+        except sqlite3.Error as e:
+            print(f"[cache error] {e}")
+    
+    def close(self):
+        """Close every thread's connection - only once nothing else is using the store"""
+        with self._lock:
+            conns = list(self._conns.values())
+            self._conns.clear()
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+CACHE_BACKENDS = {
+    'sqlite': SqliteCacheStore,
+    'none': NullCacheStore
+}
+
+CACHE_STORE = None
+_CACHE_STORE_LOCK = threading.Lock()
+
+def get_cache_store():
+    """Shared cache backend, opened on first use"""
+    global CACHE_STORE
+    if CACHE_STORE is None:
+        with _CACHE_STORE_LOCK:
+            if CACHE_STORE is None:
+                CACHE_STORE = CACHE_BACKENDS[CACHE_BACKEND]()
+    return CACHE_STORE
+
+def set_cache_store(store):
+    """Swap the cache backend (--nocache, tests), returns the old one"""
+    global CACHE_STORE
+    with _CACHE_STORE_LOCK:
+        old, CACHE_STORE = CACHE_STORE, store
+    return old
+
 def setup_cache():
     if not os.path.exists(CACHE_DIR):
         os.makedirs(CACHE_DIR)
         print(f"[cache] created {CACHE_DIR}")
 
-def get_cache_path(url):
-    from hashlib import md5
-    url_hash = md5(url.encode()).hexdigest()
-    return os.path.join(CACHE_DIR, f"{url_hash}.txt")
+def cache_key(url):
+    return hashlib.md5(url.encode()).hexdigest()
 
 def load_from_cache(url):
-    cache_path = get_cache_path(url)
-    if os.path.exists(cache_path):
-        cache_age = datetime.now().timestamp() - os.path.getmtime(cache_path)
-        if cache_age < 86400:  # 24 hours
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if content and len(content) > 100:
-                        return content
-            except Exception:
-                pass
+    entry = get_cache_store().get('text', cache_key(url))
+    if entry and entry.value and len(entry.value) > 100:
+        return entry.value
     return None
 
-def save_to_cache(url, content):
+def save_to_cache(url, content, headers=None):
+    get_cache_store().put('text', cache_key(url), content, ttl=TEXT_CACHE_TTL,
+                          meta=cache_validators(url, headers or {}))
+
+def is_fresh(entry):
+    return entry.expires is None or entry.expires > time.time()
+
+def save_raw_response(url, fetched):
+    """Raw tier under the text cache - compressed html + headers + final url, so we can re-extract offline"""
+    if not fetched or not fetched.html:
+        return
+    headers = {name: fetched.headers[name] for name in RAW_CACHE_HEADERS if fetched.headers.get(name)}
+    get_cache_store().put('raw', cache_key(url), fetched.html, ttl=RAW_CACHE_TTL,
+                          meta={'url': url, 'final_url': fetched.url, 'status': fetched.status, 'headers': headers})
+
+def load_raw_response(url):
+    """FetchResult from the raw tier (stale is fine, it's for offline work) or None"""
+    entry = get_cache_store().get('raw', cache_key(url), include_expired=True)
+    if not entry or not entry.value:
+        return None
+    meta = entry.meta or {}
+    return FetchResult(entry.value, meta.get('status', 200),
+                       CaseInsensitiveDict(meta.get('headers', {})), meta.get('final_url', url))
+
+def topic_cache_key(topic, days_back):
+    return f"{' '.join(topic.lower().split())}|{days_back}"
+
+def save_topic_articles(topic, days_back, articles):
+    """Remember which articles a search returned, --reextract works from this list"""
+    get_cache_store().put('topic', topic_cache_key(topic, days_back), json.dumps(articles),
+                          ttl=RAW_CACHE_TTL)
+
+def load_topic_articles(topic, days_back):
+    entry = get_cache_store().get('topic', topic_cache_key(topic, days_back), include_expired=True)
+    if not entry:
+        return None
     try:
-        cache_path = get_cache_path(url)
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-    except Exception as e:
-        print(f"[cache error] {e}")
+        return json.loads(entry.value)
+    except ValueError:
+        return None
+
+def load_topic_state(topic, days_back):
+    """--incremental: the last run's articles (url -> hash, summary, ...), overview and leads"""
+    entry = get_cache_store().get('state', topic_cache_key(topic, days_back))
+    if not entry:
+        return None
+    try:
+        return json.loads(entry.value)
+    except ValueError:
+        return None
+
+def save_topic_state(topic, days_back, state):
+    get_cache_store().put('state', topic_cache_key(topic, days_back), json.dumps(state), ttl=TOPIC_STATE_TTL)
+
+def content_hash(text):
+    return hashlib.sha1(' '.join((text or '').split()).encode('utf-8', errors='ignore')).hexdigest()
+
+def remove_legacy_cache_files():
+    """The old layout: one <md5>.txt per url plus summaries/*.json and decoded_urls.json"""
+    removed = 0
+    legacy = [os.path.join(CACHE_DIR, n) for n in os.listdir(CACHE_DIR) if n.endswith('.txt')] \
+        if os.path.isdir(CACHE_DIR) else []
+    legacy.append(os.path.join(CACHE_DIR, 'decoded_urls.json'))
+    summaries_dir = os.path.join(CACHE_DIR, 'summaries')
+    if os.path.isdir(summaries_dir):
+        legacy += [os.path.join(summaries_dir, n) for n in os.listdir(summaries_dir)]
+    for path in legacy:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    try:
+        os.rmdir(summaries_dir)
+    except OSError:
+        pass
+    return removed
+
+def cache_main(argv):
+    """scout-agent.py cache stats|prune - cache maintenance"""
+    parser = argparse.ArgumentParser(prog='scout-agent.py cache', description='Cache maintenance')
+    parser.add_argument('action', choices=['stats', 'prune', 'extractors'],
+                        help='extractors: per-domain extractor stats and the cpu they saved')
+    parser.add_argument('--max-mb', type=float, default=None,
+                        help=f'prune: size cap in MB (default: {CACHE_MAX_BYTES // (1024 * 1024)})')
+    parser.add_argument('--json', action='store_true', help='stats: machine readable output')
+    args = parser.parse_args(argv)
+    
+    store = get_cache_store()
+    if args.action == 'extractors':
+        export = DOMAIN_EXTRACTOR_STATS.export()
+        if args.json:
+            print(json.dumps(export, indent=2))
+            return
+        for domain, stats in sorted(export['domains'].items()):
+            print(domain)
+            for name, st in sorted(stats.items(), key=lambda kv: -(kv[1]['win_rate'] or 0)):
+                rate = f"{st['win_rate'] * 100:5.1f}%" if st['win_rate'] is not None else '    - '
+                print(f"  {name:15s} {st['wins']:4d}/{st['tries']:<4d} {rate}  {st['avg_cpu_ms']:8.1f}ms  "
+                      f"skipped {st.get('skipped', 0)}")
+        print(f"estimated cpu saved: {export['est_cpu_saved_s']:.2f}s")
+        return
+    
+    if args.action == 'prune':
+        max_bytes = int(args.max_mb * 1024 * 1024) if args.max_mb is not None else None
+        removed = store.prune(max_bytes)
+        legacy = remove_legacy_cache_files()
+        if hasattr(store, 'vacuum'):
+            store.vacuum()
+        print(f"[cache] pruned {removed} entries, {legacy} old-layout files")
+    
+    info = store.stats()
+    if args.json:
+        print(json.dumps(info, indent=2))
+        return
+    print(f"[cache] {info.get('path', info['backend'])}")
+    print(f"  entries: {info['entries']} ({info.get('expired', 0)} expired)")
+    print(f"  size:    {info['bytes'] / 1024:.1f} KB of {info.get('max_bytes', 0) / (1024 * 1024):.0f} MB cap")
+    for namespace, ns in sorted(info['namespaces'].items()):
+        print(f"  {namespace:10s} {ns['entries']:6d} entries  {ns['bytes'] / 1024:9.1f} KB  {ns['expired']} expired")
+
+class DnsCache:
+    """In-process DNS cache for HttpClient's own connections (DnsCachingAdapter), skips the resolver on reconnects"""
+    
+    def __init__(self, ttl=DNS_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}  # (host, port) -> (expires, [addrinfo...])
+        self._timing = threading.local()  # this thread's last lookup / connect, for tracing
+        self.stats = {'hits': 0, 'misses': 0, 'connections': 0, 'dns_seconds': 0.0, 'connect_seconds': 0.0}
+    
+    def lookup(self, host, port, family=socket.AF_UNSPEC):
+        key = (host, port, family)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self.stats['hits'] += 1
+                self._timing.dns = 0.0
+                return entry[1]
+        
+        started = time.perf_counter()
+        infos = socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+        self._timing.dns = time.perf_counter() - started
+        with self._lock:
+            self.stats['misses'] += 1
+            self.stats['dns_seconds'] += self._timing.dns
+            self._entries[key] = (now + self.ttl, infos)
+        return infos
+    
+    def forget(self, host, port, family=socket.AF_UNSPEC):
+        with self._lock:
+            self._entries.pop((host, port, family), None)
+    
+    def take_timing(self):
+        """(dns_seconds, connect_seconds) of the connection this thread opened since the last call, or None"""
+        connect = getattr(self._timing, 'connect', None)
+        if connect is None:
+            return None
+        timing = (getattr(self._timing, 'dns', 0.0), connect)
+        self._timing.dns = self._timing.connect = None
+        return timing
+    
+    def create_connection(self, address, timeout=None, source_address=None, socket_options=None):
+        """urllib3.util.connection.create_connection with the getaddrinfo answer cached"""
+        host, port = address
+        if host.startswith('['):
+            host = host.strip('[]')
+        # same ipv4/ipv6 choice urllib3 makes, every address family in the answer gets tried
+        family = urllib3.util.connection.allowed_gai_family()
+        infos = self.lookup(host, port, family)
+        
+        started = time.perf_counter()
+        err = None
+        for af, socktype, proto, _, sockaddr in infos:
+            sock = None
+            try:
+                sock = socket.socket(af, socktype, proto)
+                for option in socket_options or ():
+                    sock.setsockopt(*option)
+                if timeout is None or isinstance(timeout, (int, float)):  # not urllib3's "default" sentinel
+                    sock.settimeout(timeout)
+                if source_address:
+                    sock.bind(source_address)
+                sock.connect(sockaddr)
+            except OSError as e:
+                err = e
+                if sock is not None:
+                    sock.close()
+                continue
+            self._timing.connect = time.perf_counter() - started
+            with self._lock:
+                self.stats['connections'] += 1
+                self.stats['connect_seconds'] += self._timing.connect
+            return sock
+        
+        self.forget(host, port, family)  # maybe the host moved
+        raise err or OSError(f"could not connect to {host}:{port}")
+
+class _DnsCachedConnection:
+    """Mixin for urllib3 connection classes: connect through self.dns, errors wrapped like urllib3 does"""
+    dns = None
+    
+    def _new_conn(self):
+        try:
+            return self.dns.create_connection((self._dns_host, self.port), self.timeout,
+                                              source_address=self.source_address,
+                                              socket_options=self.socket_options)
+        except socket.gaierror as e:
+            raise NewConnectionError(self, f"Failed to resolve '{self.host}' ({e})") from e
+        except socket.timeout as e:
+            raise ConnectTimeoutError(
+                self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})") from e
+        except OSError as e:
+            raise NewConnectionError(self, f"Failed to establish a new connection: {e}") from e
+
+def _dns_cached_pool(pool_cls, dns):
+    """pool_cls whose connections resolve through dns"""
+    conn_cls = type(pool_cls.ConnectionCls.__name__, (_DnsCachedConnection, pool_cls.ConnectionCls), {'dns': dns})
+    return type(pool_cls.__name__, (pool_cls,), {'ConnectionCls': conn_cls})
+
+class DnsCachingAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools open connections through a DnsCache - only this adapter, urllib3 stays untouched"""
+    
+    def __init__(self, dns=None, **kwargs):
+        self.dns = dns  # before super(), it builds the pool manager
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if self.dns is not None:
+            self.poolmanager.pool_classes_by_scheme = {
+                scheme: _dns_cached_pool(pool_cls, self.dns)
+                for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+            }
+
+class HttpClient:
+    """
+    The one HTTP layer search, decode and fetch all go through - a pooled
+    keep-alive session, per-host pool sizes, DNS cache and reuse metrics.
+    host_overrides={'news.google.com': 'http://127.0.0.1:8000'} sends a host's
+    requests somewhere else (local stand-in servers for tests and benchmarks).
+    """
+    
+    def __init__(self, pool_size=HTTP_POOL_SIZE, host_pool_sizes=None, dns_cache=True,
+                 host_overrides=None, session=None, verify=False, max_redirects=10):
+        self.session = session or requests.Session()
+        self.session.max_redirects = max_redirects
+        self.verify = verify
+        self.host_overrides = dict(host_overrides or {})
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'responses': 0, 'errors': 0}
+        
+        # the cache lives in our own adapters, a session passed in keeps its normal resolver
+        self.dns = DnsCache() if dns_cache and session is None else None
+        if session is None:
+            adapter = DnsCachingAdapter(self.dns, pool_connections=HTTP_POOL_HOSTS, pool_maxsize=pool_size)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            for host, size in {**HOST_POOL_SIZES, **(host_pool_sizes or {})}.items():
+                host_adapter = DnsCachingAdapter(self.dns, pool_connections=1, pool_maxsize=size)
+                self.session.mount(f'https://{host}', host_adapter)
+                self.session.mount(f'http://{host}', host_adapter)
+        
+        # every response incl. redirects, so reuse = 1 - connections / responses
+        self.session.hooks.setdefault('response', []).append(self._on_response)
+    
+    def _on_response(self, resp, *args, **kwargs):
+        with self._lock:
+            self.stats['responses'] += 1
+    
+    def _rewrite(self, url):
+        if not self.host_overrides:
+            return url
+        parsed = urlparse(url)
+        target = self.host_overrides.get(parsed.netloc.lower())
+        if not target:
+            return url
+        return target.rstrip('/') + (parsed.path or '/') + (f"?{parsed.query}" if parsed.query else '')
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        kwargs.setdefault('verify', self.verify)
+        with self._lock:
+            self.stats['requests'] += 1
+        if not TRACER.enabled:
+            try:
+                return self.session.request(method, self._rewrite(url), **kwargs)
+            except requests.RequestException:
+                with self._lock:
+                    self.stats['errors'] += 1
+                raise
+        
+        with TRACER.span('http', method=method, url=url) as span:
+            if self.dns:
+                self.dns.take_timing()  # drop anything left over from before
+            started = time.perf_counter()
+            try:
+                resp = self.session.request(method, self._rewrite(url), **kwargs)
+            except requests.RequestException:
+                with self._lock:
+                    self.stats['errors'] += 1
+                raise
+            finally:
+                timing = self.dns.take_timing() if self.dns else None
+                span['new_connection'] = timing is not None
+                if timing:
+                    span['dns_ms'] = round(timing[0] * 1000, 3)
+                    span['connect_ms'] = round(timing[1] * 1000, 3)
+            # elapsed = request sent -> headers parsed, the rest (unless streamed) is the body
+            ttfb = resp.elapsed.total_seconds()
+            span['status'] = resp.status_code
+            span['redirects'] = len(resp.history)
+            span['ttfb_ms'] = round(ttfb * 1000, 3)
+            if not kwargs.get('stream'):
+                span['bytes'] = len(resp.content)
+                span['download_ms'] = round(max(0.0, time.perf_counter() - started - ttfb) * 1000, 3)
+            return resp
+    
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+    
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+    
+    def metrics(self):
+        """Connection reuse numbers for the end of run summary"""
+        m = dict(self.stats)
+        if self.dns:
+            m.update({f"dns_{k}" if k in ('hits', 'misses') else k: v for k, v in self.dns.stats.items()})
+            m['reused'] = max(0, m['responses'] - m['connections'])
+            m['reuse_rate'] = m['reused'] / m['responses'] if m['responses'] else 0.0
+        return m
+    
+    def close(self):
+        self.session.close()
+
+HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+def get_http_client():
+    """Shared client, built on first use"""
+    global HTTP_CLIENT
+    if HTTP_CLIENT is None:
+        with _HTTP_CLIENT_LOCK:
+            if HTTP_CLIENT is None:
+                HTTP_CLIENT = HttpClient()
+    return HTTP_CLIENT
+
+def set_http_client(client):
+    """Swap the shared client (tests, local stand-in servers), returns the old one"""
+    global HTTP_CLIENT
+    with _HTTP_CLIENT_LOCK:
+        old, HTTP_CLIENT = HTTP_CLIENT, client
+    return old
+
+def format_http_metrics(m):
+    line = f"{m['responses']} responses"
+    if 'connections' in m:
+        line += (f", {m['connections']} connections ({m['reuse_rate'] * 100:.0f}% reused), "
+                 f"DNS cache {m['dns_hits']} hits / {m['dns_misses']} lookups")
+    if m['errors']:
+        line += f", {m['errors']} errors"
+    return line
+
+SUMMARY_CACHE_STATS = {'hits': 0, 'misses': 0, 'saved': 0}
+_SUMMARY_CACHE_LOCK = threading.Lock()
+
+def summary_cache_key(text, model_name, max_length, min_length):
+    """Hash of the input + everything that changes the output"""
+    h = hashlib.sha256()
+    h.update(f"v{SUMMARIZER_VERSION}|{model_name}|{max_length}|{min_length}|".encode())
+    h.update(text.encode('utf-8', errors='ignore'))
+    return h.hexdigest()
+
+def load_summary_from_cache(key):
+    if not SUMMARY_CACHE_ENABLED:
+        return None
+    entry = get_cache_store().get('summary', key)
+    with _SUMMARY_CACHE_LOCK:
+        SUMMARY_CACHE_STATS['hits' if entry else 'misses'] += 1
+    return entry.value if entry else None
+
+def save_summary_to_cache(key, summary, model_name):
+    if not SUMMARY_CACHE_ENABLED or not summary:
+        return
+    get_cache_store().put('summary', key, summary, ttl=SUMMARY_CACHE_TTL, meta={'model': model_name})
+    with _SUMMARY_CACHE_LOCK:
+        SUMMARY_CACHE_STATS['saved'] += 1
 
 def get_random_ua():
     return random.choice(USER_AGENTS)
 
+class HostThrottle:
+    """Per host politeness - same host waits RATE_LIMIT_DELAY, different hosts don't block each other"""
+    
+    def __init__(self, delay=None):
+        self.delay = RATE_LIMIT_DELAY if delay is None else delay
+        self._lock = threading.Lock()
+        self._host_locks = {}
+        self._next_allowed = {}
+    
+    def wait(self, url):
+        host = urlparse(url).netloc.lower() if url else ''
+        with self._lock:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+        
+        # hold the host lock while sleeping so requests to one site stay serial
+        with host_lock:
+            now = time.monotonic()
+            ready_at = self._next_allowed.get(host, now)
+            if ready_at > now:
+                time.sleep(ready_at - now)
+            self._next_allowed[host] = time.monotonic() + random.uniform(self.delay * 0.8, self.delay * 1.2)
+
 def decode_google_news_url(encoded_url):
     """
     Google News RSS URLs are obfuscated. This tries to decode them.
@@ -206,14 +1305,11 @@ def decode_google_news_url(encoded_url):
     
     # Method 3: Follow redirects (fallback,nuke it!!)
     try:
-        session = requests.Session()
-        session.max_redirects = 10
-        resp = session.head(
+        resp = get_http_client().head(
             encoded_url, 
             allow_redirects=True, 
             timeout=10,
-            headers={'User-Agent': get_random_ua()},
-            verify=False
+            headers={'User-Agent': get_random_ua()}
         )
         
         # did google.com redirected this away?
@@ -227,86 +1323,239 @@ def decode_google_news_url(encoded_url):
     
     return encoded_url  # just return idk
 
-def search_news(query, days_back=7, max_results=15):
-    """Search Google News RSS - with retries"""
-    encoded = quote(query)
-    rss_url = f"https://news.google.com/rss/search?q={encoded}+when:{days_back}d&hl=en-US&gl=US&ceid=US:en"
+class DecodeCache:
+    """Persistent Google News article id -> real URL, so a known article is never decoded twice"""
     
-    for attempt in range(3):
-        try:
-            resp = requests.get(
-                rss_url, 
-                timeout=REQUEST_TIMEOUT, 
-                headers={'User-Agent': get_random_ua()},
-                verify=False
-            )
-            resp.raise_for_status()
-            break
-        except requests.RequestException as e:
-            if attempt == 2:
-                print(f"[error] RSS fetch failed after 3 attempts: {e}")
-                return []
-            time.sleep(2 ** attempt)  # exponential backoff
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
     
-    try:
-        soup = BeautifulSoup(resp.text, 'xml')
-        items = soup.find_all('item')[:max_results]
-    except Exception as e:
-        print(f"[error] Failed to parse RSS: {e}")
-        return []
+    @staticmethod
+    def key(encoded_url):
+        # the article id is the stable bit, query params (?oc=5 etc) come and go
+        parsed = urlparse(encoded_url)
+        return parsed.netloc.lower() + parsed.path
     
-    articles = []
-    for item in items:
-        try:
-            title = item.title.text if item.title else "Unknown"
-            google_link = item.link.text if item.link else ""
-            
-            desc = item.description.text if item.description else ""
-            # clean the HTML 
-            try:
-                snippet = BeautifulSoup(desc, 'html.parser').get_text().strip()
-                snippet = re.sub(r'\s+', ' ', snippet)
-                if len(snippet) > 500:
-                    snippet = snippet[:497] + "..."
-            except Exception:
-                snippet = ""
-            
-            # please/try to decode it's a url!!!!!!!!!
-            real_url = decode_google_news_url(google_link)
-            
-            # is the domain d@rk l!sted? :(
-            if real_url:
-                domain = urlparse(real_url).netloc.lower()
-                if any(blacklisted in domain for blacklisted in BLACKLIST_DOMAINS):
-                    continue  # skip them!
-            
-            articles.append({
-                'title': title,
-                'url': real_url if real_url else google_link,
-                'snippet': snippet,
-                'decoded': real_url is not None and real_url != google_link
-            })
-            
-            time.sleep(random.uniform(0.1, 0.3))  # delay randomly
-        except Exception as e:
-            print(f"[warn] Failed to process item: {e}")
+    def get(self, encoded_url):
+        entry = get_cache_store().get('decode', self.key(encoded_url))
+        with self._lock:
+            self.stats['hits' if entry else 'misses'] += 1
+        return entry.value if entry else None
+    
+    def put(self, encoded_url, real_url):
+        get_cache_store().put('decode', self.key(encoded_url), real_url, ttl=DECODE_CACHE_TTL)
+
+DECODE_CACHE = DecodeCache()
+
+def decode_google_news_url_cached(encoded_url, stats=None):
+    """decode_google_news_url with the persistent cache in front. stats: the caller's own hit/miss counts"""
+    if not encoded_url or 'news.google.com' not in encoded_url:
+        return encoded_url
+    cached = DECODE_CACHE.get(encoded_url)
+    if stats is not None:
+        with DECODE_CACHE._lock:
+            stats['decode_cache_hits' if cached else 'decode_cache_misses'] += 1
+    if cached:
+        TRACER.record('decode', 0.0, url=encoded_url, cache='hit')
+        return cached
+    with TRACER.span('decode', url=encoded_url, cache='miss'):
+        real_url = decode_google_news_url(encoded_url)
+    # only remember real answers, a failed decode may work next time
+    if real_url and real_url != encoded_url:
+        DECODE_CACHE.put(encoded_url, real_url)
+    return real_url
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACE_RE = re.compile(r'\s+')
+
+def clean_snippet(desc):
+    """RSS description html -> plain text, no soup needed"""
+    if not desc:
+        return ""
+    snippet = html.unescape(_TAG_RE.sub(' ', desc))
+    snippet = _SPACE_RE.sub(' ', snippet).strip()
+    if len(snippet) > 500:
+        snippet = snippet[:497] + "..."
+    return snippet
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+def iter_feed_items(source, max_results=15):
+    """
+    Stream (title, link, snippet) out of an RSS or Atom feed while it's being read.
+    source is a file-like object (or bytes), parsing stops after max_results items.
+    """
+    if isinstance(source, (bytes, str)):
+        source = io.BytesIO(source.encode('utf-8') if isinstance(source, str) else source)
+    
+    etree = lazy_import('lxml.etree')
+    if etree is not None:
+        events = etree.iterparse(source, events=('end',), recover=True)
+    else:
+        events = ElementTree.iterparse(source, events=('end',))
+    
+    count = 0
+    for _, elem in events:
+        name = _local_name(elem.tag)
+        if name not in ('item', 'entry'):
             continue
+        
+        title, link, desc = "Unknown", "", ""
+        for child in elem:
+            child_name = _local_name(child.tag)
+            if child_name == 'title' and child.text:
+                title = child.text.strip()
+            elif child_name == 'link':
+                # rss has the url as text, atom in href
+                link = (child.text or child.get('href') or link or '').strip()
+            elif child_name in ('description', 'summary', 'content') and not desc:
+                desc = child.text or ''
+        
+        yield title, link, clean_snippet(desc)
+        
+        # done with it, keep memory flat on big feeds
+        elem.clear()
+        if etree is not None:
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        
+        count += 1
+        if count >= max_results:
+            break
+
+def _feed_article(title, google_link, snippet, real_url):
+    # is the domain d@rk l!sted? :(
+    if real_url:
+        domain = urlparse(real_url).netloc.lower()
+        if any(blacklisted in domain for blacklisted in BLACKLIST_DOMAINS):
+            return None  # skip them!
+    
+    return {
+        'title': title,
+        'url': real_url if real_url else google_link,
+        'snippet': snippet,
+        'decoded': real_url is not None and real_url != google_link
+    }
+
+def resolve_feed_items(items, workers=None, stats=None):
+    """Decode links in parallel while items keep coming, yield articles in feed order"""
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers or DECODE_WORKERS) as pool:
+        for title, link, snippet in items:
+            # please/try to decode it's a url!!!!!!!!!
+            pending.append((title, link, snippet, pool.submit(decode_google_news_url_cached, link, stats)))
+            while pending and pending[0][3].done():
+                title_, link_, snippet_, future = pending.popleft()
+                article = _feed_article(title_, link_, snippet_, future.result())
+                if article:
+                    yield article
+        
+        while pending:
+            title_, link_, snippet_, future = pending.popleft()
+            article = _feed_article(title_, link_, snippet_, future.result())
+            if article:
+                yield article
+    get_cache_store().release_threads()  # decode threads are gone, so are their sqlite connections
+
+class _TeeReader:
+    """File-like wrapper that keeps a copy of everything read through it"""
+    
+    def __init__(self, raw):
+        self.raw = raw
+        self.chunks = []
+    
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        if data:
+            self.chunks.append(data)
+        return data
+    
+    def read_all(self):
+        """What was read so far plus the rest of the stream"""
+        rest = self.raw.read()
+        if rest:
+            self.chunks.append(rest)
+        return b''.join(self.chunks)
+
+def iter_search_news(query, days_back=7, max_results=15, stats=None):
+    """Search Google News RSS - with retries, yields articles as the feed streams in"""
+    encoded = quote(query)
+    rss_url = f"https://news.google.com/rss/search?q={encoded}+when:{days_back}d&hl=en-US&gl=US&ceid=US:en"
+    
+    store = get_cache_store()
+    entry = store.get('rss', rss_url, include_expired=True)
+    if entry and is_fresh(entry):
+        TRACER.record('rss', 0.0, url=rss_url, cache='fresh')
+        yield from resolve_feed_items(iter_feed_items(entry.value, max_results), stats=stats)
+        return
+    
+    resp = None
+    # the request only - the body is parsed while it streams, inside the caller's span
+    with TRACER.span('rss', url=rss_url, cache='revalidate' if entry else 'miss') as span:
+        for attempt in range(3):
+            span['attempts'] = attempt + 1
+            try:
+                headers = {'User-Agent': get_random_ua()}
+                headers.update(conditional_headers(entry.meta if entry else None))
+                resp = get_http_client().get(
+                    rss_url, 
+                    timeout=REQUEST_TIMEOUT, 
+                    headers=headers,
+                    stream=True
+                )
+                resp.raise_for_status()
+                break
+            except requests.RequestException as e:
+                if resp is not None:
+                    resp.close()
+                    resp = None
+                if attempt == 2:
+                    print(f"[error] RSS fetch failed after 3 attempts: {e}")
+                    return
+                time.sleep(2 ** attempt)  # exponential backoff
+        span['status'] = resp.status_code
+    
+    if resp.status_code == 304 and entry:
+        # feed unchanged, parse the copy we have
+        resp.close()
+        store.put('rss', rss_url, entry.value, ttl=RSS_CACHE_TTL,
+                  meta=cache_validators(rss_url, resp.headers, entry.meta))
+        yield from resolve_feed_items(iter_feed_items(entry.value, max_results), stats=stats)
+        return
     
-    return articles
+    try:
+        resp.raw.decode_content = True  # let urllib3 un-gzip while we parse
+        body = _TeeReader(resp.raw)
+        yield from resolve_feed_items(iter_feed_items(body, max_results), stats=stats)
+        
+        validators = cache_validators(rss_url, resp.headers)
+        if len(validators) > 1:  # only worth keeping if the server gave us validators
+            store.put('rss', rss_url, body.read_all(), ttl=RSS_CACHE_TTL, meta=validators)
+    except Exception as e:
+        print(f"[error] Failed to parse RSS: {e}")
+    finally:
+        resp.close()
 
-def extract_with_newspaper3k(url):
-    """Try newspaper3k if available"""
+def search_news(query, days_back=7, max_results=15, stats=None):
+    """Search Google News RSS - the whole result list at once"""
+    return list(iter_search_news(query, days_back, max_results, stats))
+
+def extract_with_newspaper3k(url, html_content=None):
+    """Try newspaper3k if available - give it the html we already have, it downloads otherwise"""
     if not NEWSPAPER_AVAILABLE:
         return None
     
+    newspaper = lazy_import('newspaper')
+    if newspaper is None:
+        return None
+    
     try:
         article = newspaper.Article(url)
-        article.download()
+        article.download(input_html=html_content)
         article.parse()
         
         if article.text and len(article.text) > 300:
-            # author & the date (published)
-            article.nlp()  # nlp
             return article.text[:MAX_ARTICLE_LENGTH]
     except Exception as e:
         pass
@@ -314,12 +1563,16 @@ def extract_with_newspaper3k(url):
     return None
 
 def extract_with_readability(html_content):
-    """Try readability-lxml"""
+    """Try readability-lxml (html string or an lxml tree it may modify)"""
     if not READABILITY_AVAILABLE:
         return None
     
+    readability = lazy_import('readability')
+    if readability is None:
+        return None
+    
     try:
-        doc = Document(html_content)
+        doc = readability.Document(html_content)
         content_html = doc.summary()
         
         # text convert
@@ -335,8 +1588,12 @@ def extract_with_readability(html_content):
     return None
 
 def extract_with_trafilatura(html_content):
+    """html string or an lxml tree it may modify"""
     if not TRAFILATURA_AVAILABLE:
         return None
+    trafilatura = lazy_import('trafilatura')
+    if trafilatura is None:
+        return None
     
     try:
         extracted = trafilatura.extract(
@@ -444,28 +1701,256 @@ def extract_with_beautifulsoup_aggressive(html_content):
     
     return None
 
-def extract_article_text_multi(url, verbose=False):
-    """Try EVERYTHING"""
+# text density: one bottom-up pass instead of bs4 re-walking (and re-joining) nested containers
+DENSITY_SKIP_TAGS = {
+    'script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 'noscript',
+    'svg', 'form', 'button', 'input', 'select', 'textarea', 'template',
+}
+DENSITY_JUNK = re.compile(
+    r'(^|[\s_-])(ad|ads|advert|advertisement|banner|sidebar|social|share|newsletter|related|'
+    r'comments?|cookie|popup|modal|promo|disclaimer)($|[\s_-])', re.I)
+DENSITY_BLOCK_TAGS = {'p', 'h1', 'h2', 'h3', 'h4', 'li', 'blockquote', 'pre'}
+DENSITY_MIN_BLOCK = 25      # chars before a <p> counts as content
+DENSITY_MAX_LINKS = 0.5     # link density above this = menu / link list
+DENSITY_MIN_COVERAGE = 0.8  # share of the page's (non-junk, non-link) text the pick must hold, else widen / give up
+
+def extract_with_text_density(tree):
+    """
+    Linear-time main-content pick on an lxml tree (does not modify it).
+    Walks nodes in reverse document order so children are done before their parent,
+    keeping text / link-text lengths per node and crediting each paragraph to its
+    parent (and half to the grandparent). The best-scoring, least linky node wins.
+    If that holds under DENSITY_MIN_COVERAGE of the page's text (deep nesting, table
+    layouts) the widest non-linky ancestor takes over; still short = None, next extractor.
+    """
+    if tree is None or isinstance(tree, (str, bytes)):
+        return None
+    try:
+        nodes = [el for el in tree.iter() if isinstance(el.tag, str)]
+        text_len, link_len, score = {}, {}, {}
+        
+        # junk goes down the tree first - a <p> inside the comments box mustn't score for anyone
+        junk = set()
+        for el in nodes:
+            if el.getparent() in junk or el.tag.lower() in DENSITY_SKIP_TAGS \
+                    or DENSITY_JUNK.search(f"{el.get('class', '')} {el.get('id', '')}"):
+                junk.add(el)
+        
+        for el in reversed(nodes):
+            tag = el.tag.lower()
+            if el in junk:
+                text_len[el] = link_len[el] = 0
+                continue
+            
+            direct = len((el.text or '').strip())
+            total, links = direct, 0
+            for child in el:
+                tail = len((child.tail or '').strip())
+                direct += tail
+                total += text_len.get(child, 0) + tail
+                links += link_len.get(child, 0)
+            if tag == 'a':
+                links = total
+            text_len[el], link_len[el] = total, links
+            
+            if tag in DENSITY_BLOCK_TAGS:
+                if total >= DENSITY_MIN_BLOCK and links <= total * DENSITY_MAX_LINKS:
+                    parent = el.getparent()
+                    if parent is not None:
+                        score[parent] = score.get(parent, 0) + total
+                        grandparent = parent.getparent()
+                        if grandparent is not None:
+                            score[grandparent] = score.get(grandparent, 0) + total / 2
+            elif direct >= 100:
+                # <br> soup - loose text straight in a div counts for that div
+                score[el] = score.get(el, 0) + direct
+        
+        if not score:
+            return None
+        best = max(score, key=lambda el: score[el] * (1 - link_len[el] / max(text_len[el], 1)))
+        
+        # text nodes minus links, lengths are stripped like text_len so this undercounts spaces a bit
+        content = lambda el: text_len[el] - link_len[el]
+        wanted = content(nodes[0]) * DENSITY_MIN_COVERAGE
+        if content(best) < wanted:
+            # text spread over nesting levels / table cells - the widest block that isn't a link list
+            for ancestor in best.iterancestors():
+                if not isinstance(ancestor.tag, str) or ancestor.tag.lower() == 'html':
+                    break
+                if link_len[ancestor] <= text_len[ancestor] * DENSITY_MAX_LINKS:
+                    best = ancestor
+        
+        # gather paragraphs under the winner, skipping junk and anything already taken
+        blocks, skip = [], set()
+        for el in best.iter():
+            if not isinstance(el.tag, str):
+                continue
+            parent = el.getparent()
+            if parent in skip or text_len.get(el, 0) == 0:
+                skip.add(el)
+                continue
+            if el.tag.lower() in DENSITY_BLOCK_TAGS:
+                skip.add(el)
+                if link_len[el] <= text_len[el] * DENSITY_MAX_LINKS:
+                    text = ' '.join(''.join(_density_text(el)).split())
+                    if len(text) >= 20:
+                        blocks.append(text)
+        
+        if sum(len(b) for b in blocks) < 300:
+            # no paragraph markup worth the name, take the whole block (still one paragraph per block element)
+            blocks = [' '.join(part.split()) for part in ''.join(_density_text(best, breaks=True)).split('\n\n')]
+            blocks = [b for b in blocks if b]
+        full_text = '\n\n'.join(blocks)
+        if len(full_text) < wanted:
+            return None  # lost too much of the page, let the next extractor have a go
+        return full_text if len(full_text) > 300 else None
+    except Exception:
+        return None
+
+def _density_text(el, breaks=False):
+    """itertext() minus junk subtrees (an ad box inside a paragraph), breaks=True puts '\\n\\n' after blocks"""
+    if el.text:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str) and child.tag.lower() not in DENSITY_SKIP_TAGS \
+                and not DENSITY_JUNK.search(f"{child.get('class', '')} {child.get('id', '')}"):
+            yield from _density_text(child, breaks)
+            if breaks and child.tag.lower() in DENSITY_BLOCK_TAGS | {'div', 'br', 'section', 'td', 'tr'}:
+                yield '\n\n'
+        if child.tail:
+            yield child.tail
+
+def synthetic_deep_page(depth=150, paragraphs=3):
+    """Nested-div stress page: every level has a few paragraphs plus a link list"""
+    para = ("Researchers reported the measurement after months of careful work, and the "
+            "result held up when other groups repeated the experiment independently. ")
+    head, tail = [], []
+    for level in range(depth):
+        head.append(f'<div class="wrap-{level}"><ul class="menu"><li><a href="/x{level}">link {level}</a></li></ul>')
+        head.extend(f'<p>{para * 2}</p>' for _ in range(paragraphs))
+        tail.append('</div>')
+    return f"<html><head><title>deep</title></head><body>{''.join(head)}{''.join(tail)}</body></html>"
+
+def extract_bench_main(argv):
+    """scout-agent.py extract-bench [FILE...] - text density vs bs4 aggressive on the same html"""
+    parser = argparse.ArgumentParser(prog='scout-agent.py extract-bench',
+                                     description='Time the text density extractor against the bs4 fallback')
+    parser.add_argument('files', nargs='*', help='saved html pages (default: synthetic nested pages)')
+    parser.add_argument('--depth', type=int, nargs='+', default=[25, 50, 100, 200],
+                        help='nesting depths for the synthetic pages')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per page, best one counts')
+    args = parser.parse_args(argv)
+    
+    if args.files:
+        pages = []
+        for path in args.files:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                pages.append((os.path.basename(path), f.read()))
+    else:
+        pages = [(f"synthetic depth {d}", synthetic_deep_page(d)) for d in args.depth]
+    
+    def best_of(func):
+        best, result = None, None
+        for _ in range(max(args.repeat, 1)):
+            started = time.perf_counter()
+            result = func()
+            took = time.perf_counter() - started
+            best = took if best is None else min(best, took)
+        return best, result
+    
+    print(f"{'page':28s} {'KB':>7s} {'bs4 ms':>9s} {'chars':>7s} {'density ms':>11s} {'chars':>7s} {'speedup':>8s}")
+    for name, html_content in pages:
+        bs4_time, bs4_text = best_of(lambda: extract_with_beautifulsoup_aggressive(html_content))
+        # parse included, bs4 pays for its own parse too
+        density_time, density_text = best_of(lambda: extract_with_text_density(ParsedPage(name, html_content).tree))
+        print(f"{name[:28]:28s} {len(html_content) / 1024:7.1f} {bs4_time * 1000:9.1f} {len(bs4_text or ''):7d} "
+              f"{density_time * 1000:11.1f} {len(density_text or ''):7d} {bs4_time / max(density_time, 1e-9):7.1f}x")
+
+def extract_article_text_multi(url, verbose=False, throttle=None):
+    """Try EVERYTHING (throttle, if given, is only waited on before real network requests)"""
     if not url or 'google.com' in url:
         return ""
     
-    # is cache there?    
-    cached = load_from_cache(url)
+    with TRACER.span('fetch', url=url, cache='miss'):
+        cached, fetched = fetch_or_revalidate(url, verbose, throttle)
     if cached:
+        return cached
+    if not fetched:
+        return ""
+    
+    return extract_text_from_html(url, fetched.html, verbose, fetched.headers)
+
+def fetch_or_revalidate(url, verbose=False, throttle=None):
+    """
+    (cached_text, fetch_result) - cached_text when the cache is fresh or the
+    server answers 304 to our validators, else the fresh download to extract.
+    """
+    # is cache there?
+    entry = get_cache_store().get('text', cache_key(url), include_expired=True)
+    if entry and entry.value and len(entry.value) > 100 and is_fresh(entry):
         if verbose:
             print(f"[cache hit]")
-        return cached
+        TRACER.annotate(cache='hit')
+        return entry.value, None
     
     # check domain d@rk l!st!!!
     domain = urlparse(url).netloc.lower()
     if any(blacklisted in domain for blacklisted in BLACKLIST_DOMAINS):
         if verbose:
             print(f"[blacklisted] {domain}")
-        return ""
+        TRACER.annotate(cache='blacklisted')
+        return None, None
+    
+    validators = entry.meta if entry and entry.value else None
+    if throttle:
+        throttle.wait(url)
+    fetched = fetch_article(url, verbose, validators)
     
-    html_content = None
-    extracted_text = None
+    if fetched and fetched.status == 304:
+        # unchanged since we extracted it, no download, no extractors
+        if verbose:
+            print(f"[304 not modified]")
+        TRACER.annotate(cache='304')
+        get_cache_store().put('text', cache_key(url), entry.value, ttl=TEXT_CACHE_TTL,
+                              meta=cache_validators(url, fetched.headers, validators))
+        get_cache_store().touch('raw', cache_key(url), ttl=RAW_CACHE_TTL)
+        return entry.value, None
+    
+    # keep the raw page even if extraction fails later
+    save_raw_response(url, fetched)
+    
+    if not fetched and entry and entry.value:
+        # couldn't reach it, stale text beats a snippet
+        if verbose:
+            print(f"[stale cache]")
+        TRACER.annotate(cache='stale')
+        return entry.value, None
     
+    return None, fetched
+
+def conditional_headers(validators):
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+def cache_validators(url, headers, previous=None):
+    """ETag / Last-Modified worth keeping next to a cache entry (a 304 may omit them)"""
+    previous = previous or {}
+    meta = {'url': url}
+    etag = headers.get('ETag') or previous.get('etag')
+    last_modified = headers.get('Last-Modified') or previous.get('last_modified')
+    if etag:
+        meta['etag'] = etag
+    if last_modified:
+        meta['last_modified'] = last_modified
+    return meta
+
+def fetch_article(url, verbose=False, validators=None):
+    """Download the page -> FetchResult or None. status is 304 (html None) if validators still match"""
     # try again
     for attempt in range(2):
         try:
@@ -487,15 +1972,18 @@ def extract_article_text_multi(url, verbose=False):
             # some sites refrence
             if attempt == 1:
                 headers['Referer'] = 'https://www.google.com/'
+            headers.update(conditional_headers(validators))
             
-            resp = requests.get(
+            resp = get_http_client().get(
                 url, 
                 timeout=REQUEST_TIMEOUT, 
                 headers=headers, 
-                allow_redirects=True,
-                verify=False
+                allow_redirects=True
             )
             
+            if resp.status_code == 304 and validators:
+                return FetchResult(None, 304, resp.headers, resp.url)
+            
             if resp.status_code != 200:
                 if verbose:
                     print(f"[HTTP {resp.status_code}]")
@@ -508,8 +1996,7 @@ def extract_article_text_multi(url, verbose=False):
                     print(f"[not html] {content_type[:30]}")
                 continue
             
-            html_content = resp.text
-            break
+            return FetchResult(resp.text, resp.status_code, resp.headers, resp.url)
             
         except requests.Timeout:
             if verbose:
@@ -526,154 +2013,949 @@ def extract_article_text_multi(url, verbose=False):
                 print(f"[error] {type(e).__name__}")
             continue
     
-    if not html_content:
+    return None
+
+def reextract_article(url, verbose=False):
+    """Rebuild text from the raw tier, never touches the network"""
+    if not url or 'google.com' in url:
         return ""
+    raw = load_raw_response(url)
+    if raw:
+        return extract_text_from_html(url, raw.html, verbose, raw.headers)
+    
+    # no raw page, last extracted text is all we have
+    entry = get_cache_store().get('text', cache_key(url), include_expired=True)
+    if verbose:
+        print(f"[no raw html{', using cached text' if entry else ''}]")
+    return entry.value if entry and entry.value else ""
+
+class ParsedPage:
+    """One download, one parse - every extractor in the cascade works off this"""
+    
+    def __init__(self, url, html_content):
+        self.url = url
+        self.html = html_content
+        self.parse_seconds = 0.0
+        self._tree = None
+        self._parsed = False
+    
+    @property
+    def tree(self):
+        """lxml document, parsed on first use (None without lxml or on garbage input)"""
+        if not self._parsed:
+            self._parsed = True
+            lxml_html = lazy_import('lxml.html')
+            if lxml_html is not None:
+                started = time.thread_time()
+                try:
+                    data = self.html.encode('utf-8', errors='replace') if isinstance(self.html, str) else self.html
+                    parser = lxml_html.HTMLParser(encoding='utf-8', remove_comments=True)
+                    self._tree = lxml_html.document_fromstring(data, parser=parser)
+                except Exception:
+                    self._tree = None
+                self.parse_seconds = time.thread_time() - started
+        return self._tree
+    
+    def tree_copy(self):
+        """Extractors prune whatever they get, so each one gets its own copy (copying beats re-parsing)"""
+        tree = self.tree
+        return copy.deepcopy(tree) if tree is not None else self.html
+
+# try everything!!!! - in this order, each gets the shared page
+EXTRACTORS = [
+    ("trafilatura", lambda page: extract_with_trafilatura(page.tree_copy()) if TRAFILATURA_AVAILABLE else None),
+    ("newspaper3k", lambda page: extract_with_newspaper3k(page.url, page.html) if NEWSPAPER_AVAILABLE else None),
+    ("readability", lambda page: extract_with_readability(page.tree_copy()) if READABILITY_AVAILABLE else None),
+    ("text density", lambda page: extract_with_text_density(page.tree)),
+    # old fallback, quadratic on deep pages - only when lxml couldn't give us a tree
+    ("bs4 aggressive", lambda page: extract_with_beautifulsoup_aggressive(page.html) if page.tree is None else None),
+]
+
+EXTRACTOR_STATS = {}  # name -> calls / wins / cpu_seconds
+_EXTRACTOR_STATS_LOCK = threading.Lock()
+
+def record_extractor_time(name, cpu_seconds, won):
+    with _EXTRACTOR_STATS_LOCK:
+        st = EXTRACTOR_STATS.setdefault(name, {'calls': 0, 'wins': 0, 'cpu_seconds': 0.0})
+        st['calls'] += 1
+        st['wins'] += int(won)
+        st['cpu_seconds'] += cpu_seconds
+
+def format_extractor_stats():
+    with _EXTRACTOR_STATS_LOCK:
+        return ', '.join(
+            f"{name} {st['cpu_seconds']:.2f}s/{st['calls']}" + (f" ({st['wins']} won)" if st['wins'] else '')
+            for name, st in EXTRACTOR_STATS.items())
+
+GARBAGE_PATTERNS = [
+    r'Advertisement\s*',
+    r'Sponsored\s*',
+    r'Sign up for.*newsletter',
+    r'Subscribe to.*',
+    r'Read more:.*',
+    r'Continue reading.*',
+    r'Originally published.*',
+    r'Copyright ©.*',
+    r'All rights reserved.*'
+]
+
+def clean_extracted_text(result):
+    # super duper cleaning
+    result = re.sub(r'\s+', ' ', result)
+    result = re.sub(r'\n\s*\n', '\n\n', result)
+    
+    # Garbage
+    for pattern in GARBAGE_PATTERNS:
+        result = re.sub(pattern, '', result, flags=re.IGNORECASE)
+    
+    return result.strip()[:MAX_ARTICLE_LENGTH]
+
+class DomainExtractorStats:
+    """
+    What worked where - per domain, per extractor tries/wins/cpu/chars, kept
+    in the cache store. plan() puts the best extractor for a domain first and
+    drops ones that never work there (with the odd retry in case the site changed).
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._domains = {}
+        self._dirty = set()  # domains changed since the last flush
+        self._pages = 0
+    
+    def _load(self, domain):
+        # caller holds the lock
+        if domain not in self._domains:
+            entry = get_cache_store().get('extractor_stats', domain)
+            try:
+                self._domains[domain] = json.loads(entry.value) if entry else {}
+            except ValueError:
+                self._domains[domain] = {}
+        return self._domains[domain]
+    
+    def plan(self, domain, extractors=None):
+        """(ordered extractors to try, names skipped)"""
+        extractors = list(extractors or EXTRACTORS)
+        if not ADAPTIVE_EXTRACTORS or not domain:
+            return extractors, []
+        with self._lock:
+            stats = {name: dict(st) for name, st in self._load(domain).items()}
+        
+        def score(item):
+            st = stats.get(item[0], {})
+            tries, wins = st.get('tries', 0), st.get('wins', 0)
+            # (wins+1)/(tries+2) so unknown extractors sit at 0.5, cheap ones win ties
+            avg_cpu = st.get('cpu', 0.0) / tries if tries else 0.0
+            return (-(wins + 1) / (tries + 2), avg_cpu)
+        
+        ordered = sorted(extractors, key=score)  # stable, keeps default order for unknowns
+        keep, skipped = [], []
+        for item in ordered:
+            st = stats.get(item[0], {})
+            hopeless = st.get('tries', 0) >= EXTRACTOR_SKIP_AFTER and not st.get('wins')
+            if hopeless and random.random() >= EXTRACTOR_RETRY_RATE:
+                skipped.append(item[0])
+            else:
+                keep.append(item)
+        if not keep:  # never skip everything - the best ranked one still gets a go
+            keep, skipped = ordered[:1], [name for name, _ in ordered[1:]]
+        return keep, skipped
     
-    # try everything!!!!
-    methods = [
-        ("trafilatura", lambda: extract_with_trafilatura(html_content)),
-        ("newspaper3k", lambda: extract_with_newspaper3k(url) if NEWSPAPER_AVAILABLE else None),
-        ("readability", lambda: extract_with_readability(html_content)),
-        ("bs4 aggressive", lambda: extract_with_beautifulsoup_aggressive(html_content)),
-    ]
+    def record(self, domain, name, won, cpu, chars):
+        if not domain:
+            return
+        with self._lock:
+            st = self._load(domain).setdefault(name, {'tries': 0, 'wins': 0, 'cpu': 0.0, 'chars': 0, 'skipped': 0})
+            st['tries'] += 1
+            st['wins'] += int(won)
+            st['cpu'] += cpu
+            st['chars'] += chars if won else 0
     
-    for method_name, extract_func in methods:
+    def record_skipped(self, domain, names):
+        """Extractors the default order would have run on this page but we didn't"""
+        if not domain or not names:
+            return
+        with self._lock:
+            stats = self._load(domain)
+            for name in names:
+                stats.setdefault(name, {'tries': 0, 'wins': 0, 'cpu': 0.0, 'chars': 0, 'skipped': 0})
+                stats[name]['skipped'] = stats[name].get('skipped', 0) + 1
+    
+    def save(self, domain):
+        """Page done - the domain gets written with the next flush, every EXTRACTOR_STATS_FLUSH_EVERY pages"""
+        if not domain:
+            return
+        with self._lock:
+            self._dirty.add(domain)
+            self._pages += 1
+            due = self._pages % EXTRACTOR_STATS_FLUSH_EVERY == 0
+        if due:
+            self.flush()
+    
+    def flush(self):
+        """Write every changed domain to the cache store"""
+        with self._lock:
+            values = {domain: json.dumps(self._domains[domain]) for domain in self._dirty}
+            self._dirty.clear()
+        for domain, value in values.items():
+            get_cache_store().put('extractor_stats', domain, value, ttl=None)
+    
+    def export(self):
+        """Everything we know, plus a rough cpu saved by skipping/reordering"""
+        domains = {}
+        for domain, entry in get_cache_store().items('extractor_stats'):
+            try:
+                domains[domain] = json.loads(entry.value)
+            except ValueError:
+                continue
+        with self._lock:
+            domains.update({d: json.loads(json.dumps(st)) for d, st in self._domains.items() if st})
+        
+        total_saved = 0.0
+        for domain, stats in domains.items():
+            for name, st in stats.items():
+                avg_cpu = st['cpu'] / st['tries'] if st.get('tries') else 0.0
+                st['win_rate'] = round(st['wins'] / st['tries'], 3) if st.get('tries') else None
+                st['avg_cpu_ms'] = round(avg_cpu * 1000, 2)
+                st['est_cpu_saved_s'] = round(avg_cpu * st.get('skipped', 0), 3)
+                total_saved += st['est_cpu_saved_s']
+        return {'domains': domains, 'est_cpu_saved_s': round(total_saved, 3)}
+
+DOMAIN_EXTRACTOR_STATS = DomainExtractorStats()
+atexit.register(DOMAIN_EXTRACTOR_STATS.flush)
+
+def run_extractor_cascade(url, html_content, names):
+    """
+    The pure part of extraction, safe to run in a worker process: try the named
+    extractors in order, stop at the first real result.
+    Returns (raw_result or None, [(name, won, cpu_seconds, chars)], error or None)
+    """
+    funcs = dict(EXTRACTORS)
+    page = ParsedPage(url, html_content)
+    records = []
+    
+    for method_name in names:
+        started = time.thread_time()
         try:
-            result = extract_func()
-            if result and len(result) > 300:
-                if verbose:
-                    print(f"[{method_name}: {len(result)} chars]")
-                
-                # super duper cleaning
-                result = re.sub(r'\s+', ' ', result)
-                result = re.sub(r'\n\s*\n', '\n\n', result)
-                
-                # Garbage
-                garbage_patterns = [
-                    r'Advertisement\s*',
-                    r'Sponsored\s*',
-                    r'Sign up for.*newsletter',
-                    r'Subscribe to.*',
-                    r'Read more:.*',
-                    r'Continue reading.*',
-                    r'Originally published.*',
-                    r'Copyright ©.*',
-                    r'All rights reserved.*'
-                ]
-                
-                for pattern in garbage_patterns:
-                    result = re.sub(pattern, '', result, flags=re.IGNORECASE)
-                
-                # x and save
-                result = result.strip()[:MAX_ARTICLE_LENGTH]
-                save_to_cache(url, result)
-                return result
+            result = funcs[method_name](page)
         except Exception:
-            continue
+            result = None
+        cpu = time.thread_time() - started
+        won = bool(result and len(result) > 300)
+        records.append((method_name, won, cpu, len(result) if result else 0))
+        if won:
+            break
+    else:
+        result = None
+    
+    if page.parse_seconds:
+        records.insert(0, ('parse', False, page.parse_seconds, 0))
+    return result, records, None
+
+def extract_text_from_html(url, html_content, verbose=False, headers=None):
+    """Run the extractor cascade on already downloaded html, caches the winner"""
+    domain = urlparse(url).netloc.lower().replace('www.', '') if url else ''
+    extractors, skipped = DOMAIN_EXTRACTOR_STATS.plan(domain)
+    names = [name for name, _ in extractors]
+    if verbose and (skipped or extractors[0] is not EXTRACTORS[0]):
+        print(f"[order for {domain}: {', '.join(names)}"
+              f"{' | skip ' + ', '.join(skipped) if skipped else ''}]")
+    
+    # try everything!!!! (in a worker process with a time limit, if there's a pool)
+    started = time.perf_counter()
+    if EXTRACTION_POOL is not None:
+        result, records, error = EXTRACTION_POOL.run(url, html_content, names)
+    else:
+        result, records, error = run_extractor_cascade(url, html_content, names)
+    
+    tried = []
+    for method_name, won, cpu, chars in records:
+        record_extractor_time(method_name, cpu, won)
+        if method_name != 'parse':
+            tried.append(method_name)
+            DOMAIN_EXTRACTOR_STATS.record(domain, method_name, won, cpu, chars)
+    
+    # what the default order would have run before getting here, but we didn't
+    winner = tried[-1] if result else None
+    default_names = [name for name, _ in EXTRACTORS]
+    before = default_names[:default_names.index(winner)] if winner in default_names else default_names
+    if not error:
+        DOMAIN_EXTRACTOR_STATS.record_skipped(domain, [name for name in before if name not in tried])
+    DOMAIN_EXTRACTOR_STATS.save(domain)
+    
+    if TRACER.enabled:
+        TRACER.record('extract', time.perf_counter() - started, sum(cpu for _, _, cpu, _ in records),
+                      url=url, winner=winner, chars=len(result) if result else 0, bytes=len(html_content or ''),
+                      pool=EXTRACTION_POOL is not None, error=error,
+                      extractors={name: round(cpu * 1000, 3) for name, _, cpu, _ in records})
+    
+    if result:
+        if verbose:
+            print(f"[{winner}: {len(result)} chars, {records[-1][2] * 1000:.0f}ms cpu]")
+        
+        # x and save
+        result = clean_extracted_text(result)
+        save_to_cache(url, result, headers)
+        return result
     
     # if we are here, then congrats!  all methods are failed!!!! :(
     if verbose:
-        print(f"[all methods failed]")
+        print(f"[{error}]" if error else f"[all methods failed]")
     
     return ""
 
-def summarize_text(text, max_len=180):
-    if not text or len(text) < 100:
-        return text
+def _extraction_worker(conn, cpu_limit):
+    """Worker process loop: (url, html, names) in, run_extractor_cascade() out"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # ctrl-c is the parent's business
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            break
+        if task is None:
+            break
+        
+        if cpu_limit and resource is not None:
+            # RLIMIT_CPU counts the whole process, so move the line for every page.
+            # going over gets us SIGXCPU, the parent sees a dead worker and replaces it
+            used = resource.getrusage(resource.RUSAGE_SELF)
+            soft = int(used.ru_utime + used.ru_stime + cpu_limit) + 1
+            _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+            if hard != resource.RLIM_INFINITY:
+                soft = min(soft, hard)
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+        
+        url, html_content, names = task
+        try:
+            outcome = run_extractor_cascade(url, html_content, names)
+        except Exception as e:
+            outcome = (None, [], f"worker error: {type(e).__name__}")
+        try:
+            conn.send(outcome)
+        except (OSError, ValueError):
+            break
+
+class ExtractionPool:
+    """
+    Process pool for the CPU heavy extractors (they hold the GIL). Each page
+    gets a wall clock limit (and a CPU limit where RLIMIT_CPU exists); a worker
+    that blows it is killed and replaced, the page just counts as failed.
+    """
+    
+    def __init__(self, processes=None, timeout=EXTRACTION_TIMEOUT, cpu_limit=EXTRACTION_CPU_LIMIT):
+        self.processes = max(1, processes or available_cores())
+        self.timeout = timeout
+        self.cpu_limit = cpu_limit
+        methods = multiprocessing.get_all_start_methods()
+        # not fork - the parent has http/pipeline threads running and their locks would come along
+        self._ctx = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {'pages': 0, 'timeouts': 0, 'crashes': 0, 'restarts': 0}
+        for _ in range(self.processes):
+            self._idle.put(self._spawn())
+    
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        proc = self._ctx.Process(target=_extraction_worker, args=(child_conn, self.cpu_limit),
+                                 name='scout-extract', daemon=True)
+        proc.start()
+        child_conn.close()
+        return proc, parent_conn
     
-    # try bumble bee first 
-    if SUMMARIZER:
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+    
+    def run(self, url, html_content, names):
+        """Same contract as run_extractor_cascade"""
+        proc, conn = worker = self._idle.get()
+        self._count('pages')
         try:
-            # estimate token count atleast roughly
-            words = text.split()
-            if len(words) < 60:
-                return text
-            
-            # TL config
-            if len(words) > 800:
-                target_max = min(max_len, 150)
-                target_min = max(60, int(target_max * 0.4))
-            else:
-                target_max = min(max_len, int(len(words) * 0.6))
-                target_min = max(40, int(target_max * 0.4))
-            
-            # just suppress it
-            old_stdout = sys.stdout
-            old_stderr = sys.stderr
-            sys.stdout = open(os.devnull, 'w')
-            sys.stderr = open(os.devnull, 'w')
-            
+            conn.send((url, html_content, names))
+            if conn.poll(self.timeout):
+                outcome = conn.recv()
+                self._idle.put(worker)
+                return outcome
+            reason, error = 'timeouts', f"extraction timed out after {self.timeout:g}s"
+        except (EOFError, OSError):
+            # died mid page, most likely SIGXCPU
+            reason, error = 'crashes', "extraction worker died (cpu limit?)"
+        
+        # hung or dead - kill it, put a fresh one in its place
+        self._count(reason)
+        proc.kill()
+        proc.join(1)
+        conn.close()
+        if not self._closed:
+            self._idle.put(self._spawn())
+            self._count('restarts')
+        return None, [], error
+    
+    def close(self):
+        self._closed = True
+        while True:
             try:
-                result = SUMMARIZER(
-                    text, 
-                    max_length=target_max, 
-                    min_length=target_min, 
-                    do_sample=False,
-                    truncation=True
-                )
-            finally:
-                sys.stdout.close()
-                sys.stderr.close()
-                sys.stdout = old_stdout
-                sys.stderr = old_stderr
-            
-            if result and isinstance(result, list) and len(result) > 0:
-                summary = result[0].get('summary_text', '')
-                if summary:
-                    return summary.strip()
-        except Exception as e:
-            pass
+                proc, conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            proc.join(1)
+            if proc.is_alive():
+                proc.kill()
+            conn.close()
+
+def available_cores():
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+EXTRACTION_POOL = None
+
+def set_extraction_pool(pool):
+    """Run extraction in this ExtractionPool (None = in the calling thread), returns the old one"""
+    global EXTRACTION_POOL
+    old, EXTRACTION_POOL = EXTRACTION_POOL, pool
+    return old
+
+_SUMMARIZE_LOCK = threading.Lock()
+def quiet_model_logs(transformers):
+    """
+    Model chatter off at the source. Not by swapping sys.stdout/stderr - fetch/extract
+    threads and other serve jobs print progress while the model runs.
+    """
+    transformers.logging.set_verbosity_error()
+    if hasattr(transformers.logging, 'disable_progress_bar'):
+        transformers.logging.disable_progress_bar()
+    for name in ('transformers', 'torch', 'optimum', 'onnxruntime'):
+        logging.getLogger(name).setLevel(logging.ERROR)
+    warnings.filterwarnings("ignore", module=r"(transformers|torch|optimum|onnxruntime)")
+
+def summary_lengths(word_count, max_len=180):
+    """(max_length, min_length) for a text this long - batches group on this pair, so it must match a single call"""
+    # TL config
+    if word_count > 800:
+        target_max = min(max_len, 150)
+        target_min = max(60, int(target_max * 0.4))
+    else:
+        # everything past ~300 words hits the max_len cap, so most articles share a pair anyway
+        target_max = min(max_len, int(word_count * 0.6))
+        target_min = max(40, int(target_max * 0.4))
+    return target_max, target_min
+
+def summarize_text(text, max_len=180, stats=None):
+    return summarize_batch([text], max_len, batch_size=1, stats=stats)[0]
+
+_TOKEN_CACHE = OrderedDict()  # (model, sha1 of text) -> [(sentence, tokens)], per document
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+def sentence_token_counts(text, tokenizer, model_name):
+    """Split into sentences and count model tokens for each - once per document"""
+    key = (model_name, hashlib.sha1(text.encode('utf-8', errors='ignore')).hexdigest())
+    with _TOKEN_CACHE_LOCK:
+        if key in _TOKEN_CACHE:
+            _TOKEN_CACHE.move_to_end(key)
+            return _TOKEN_CACHE[key]
     
+    sentences = [s.strip() for s in SENTENCE_SPLIT.split(text) if s.strip()]
+    ids = tokenizer(sentences, add_special_tokens=False)['input_ids'] if sentences else []
+    counted = [(s, len(i)) for s, i in zip(sentences, ids)]
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = counted
+        while len(_TOKEN_CACHE) > TOKEN_CACHE_DOCS:
+            _TOKEN_CACHE.popitem(last=False)
+    return counted
+
+def chunk_for_model(text, summarizer, model_name):
+    """
+    Cut text into pieces that fit the model's input, on sentence boundaries.
+    One piece means it fits as is; None means no tokenizer to measure with.
+    """
+    tokenizer = getattr(summarizer, 'tokenizer', None)
+    if tokenizer is None:
+        return None
+    budget = min(SUMMARY_CHUNK_TOKENS, int(getattr(tokenizer, 'model_max_length', 1024)) - 16)
     try:
-        # SiS
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 25]
-        
-        if not sentences:
+        counted = sentence_token_counts(text, tokenizer, model_name)
+    except Exception:
+        return None
+    if sum(n for _, n in counted) <= budget:
+        return [text]
+    
+    chunks, current, used = [], [], 0
+    for sentence, n in counted:
+        if n > budget:
+            # one monster "sentence" (a table, a list with no periods) - cut it by words
+            words = sentence.split()
+            step = max(1, int(len(words) * budget / n * 0.9))
+            pieces = [(' '.join(words[k:k + step]), budget) for k in range(0, len(words), step)]
+        else:
+            pieces = [(sentence, n)]
+        for piece, cost in pieces:
+            if current and used + cost > budget:
+                chunks.append(' '.join(current))
+                current, used = [], 0
+            current.append(piece)
+            used += cost
+    if current:
+        chunks.append(' '.join(current))
+    return chunks
+
+def _run_summarizer(summarizer, jobs, batch_size):
+    """
+    jobs: [(text, max_length, min_length)] -> [summary or None]. Jobs with the same
+    lengths share a model call, batch_size texts at a time.
+    """
+    outputs = [None] * len(jobs)
+    buckets = {}
+    for j, (_, target_max, target_min) in enumerate(jobs):
+        buckets.setdefault((target_max, target_min), []).append(j)
+    
+    with _SUMMARIZE_LOCK, inference_context():
+        for (target_max, target_min), indices in sorted(buckets.items()):
+            for start in range(0, len(indices), batch_size):
+                chunk = indices[start:start + batch_size]
+                span = TRACER.begin('summarize.model', texts=len(chunk), max_length=target_max, min_length=target_min)
+                try:
+                    output = summarizer(
+                        [jobs[j][0] for j in chunk],
+                        max_length=target_max,
+                        min_length=target_min,
+                        do_sample=False,
+                        truncation=True,
+                        batch_size=len(chunk)
+                    )
+                except Exception as e:
+                    span['error'] = type(e).__name__
+                    continue  # extractive fallback later
+                finally:
+                    TRACER.end(span)
+                
+                for j, result in zip(chunk, output or []):
+                    if isinstance(result, list):  # some versions nest per input
+                        result = result[0] if result else {}
+                    summary = result.get('summary_text', '') if isinstance(result, dict) else ''
+                    outputs[j] = summary.strip() or None
+                if TRACER.enabled:
+                    _count_summary_tokens(span, summarizer, [jobs[j][0] for j in chunk], [outputs[j] or '' for j in chunk])
+    return outputs
+
+def _count_summary_tokens(span, summarizer, inputs, outputs):
+    """Tokens in / out of one model call, for the trace (only tokenized when tracing)"""
+    tokenizer = getattr(summarizer, 'tokenizer', None)
+    try:
+        if tokenizer is not None:
+            span['input_tokens'] = sum(len(ids) for ids in tokenizer(inputs, truncation=True)['input_ids'])
+            span['output_tokens'] = sum(len(ids) for ids in tokenizer(outputs)['input_ids'])
+        else:
+            span['input_words'] = sum(len(t.split()) for t in inputs)
+            span['output_words'] = sum(len(t.split()) for t in outputs)
+    except Exception:
+        pass
+
+def _length_job(text, max_len):
+    return (text, *summary_lengths(len(text.split()), max_len))
+
+def summarize_batch(texts, max_len=180, batch_size=None, stats=None):
+    """
+    Summarize many texts in as few model calls as possible. Texts are grouped
+    into length buckets, each bucket runs with its own max_length/min_length -
+    the same settings summarize_text gives a text on its own, so the output
+    per article doesn't depend on what it was batched with.
+    Texts too long for the model are cut into chunks that get summarized along
+    with everything else (map), then the partial summaries are summarized (reduce).
+    Summaries already in the summary cache never reach the model.
+    stats: the caller's own counters, gets summary_cache_hits added (the global ones mix every caller)
+    """
+    with TRACER.span('summarize', texts=len(texts)) as span:
+        results = _summarize_batch(texts, max_len, max(1, batch_size or SUMMARY_BATCH_SIZE), span)
+    if stats is not None and span.get('cache_hits'):
+        with _SUMMARY_CACHE_LOCK:
+            stats['summary_cache_hits'] += span['cache_hits']
+    return results
+
+def _summarize_batch(texts, max_len, batch_size, span):
+    results = [None] * len(texts)
+    pending = []
+    
+    for i, text in enumerate(texts):
+        if not text or len(text) < 100:
+            results[i] = text
+        elif SUMMARIZER_MODE == 'none':
             words = text.split()
-            return ' '.join(words[:60]) + '...'
-        
-        # Common words
-        scored_sentences = []
-        important_words = {'study', 'research', 'found', 'shows', 'according', 'report', 
-                          'data', 'analysis', 'results', 'concluded', 'suggests'}
+            results[i] = ' '.join(words[:60]) + ('...' if len(words) > 60 else '')
+        else:
+            pending.append(i)
+    
+    def from_cache(indices, model_name):
+        missing = []
+        for i in indices:
+            cached = None
+            if SUMMARY_CHUNKING and model_name != 'extractive':
+                cached = load_summary_from_cache(_chunked_key(texts[i], model_name, max_len))
+            cached = cached or load_summary_from_cache(_summary_key(texts[i], model_name, max_len))
+            if cached:
+                results[i] = cached
+            else:
+                missing.append(i)
+        return missing
+    
+    # cached first - a fully cached run never loads the model
+    model_name = summarizer_model_name()
+    uncached = from_cache(pending, model_name)
+    span['cache_hits'] = len(pending) - len(uncached)
+    
+    # try bumble bee first
+    summarizer = get_summarizer() if uncached else None
+    if uncached and summarizer_model_name() != model_name:
+        # model fell back to another one, its cache entries are keyed differently
+        model_name = summarizer_model_name()
+        before = len(uncached)
+        uncached = from_cache(uncached, model_name)
+        span['cache_hits'] += before - len(uncached)
+    
+    if summarizer and uncached:
+        # map: short texts and the chunks of long ones, all in one set of batched calls
+        whole, chunked = [], {}
+        for i in uncached:
+            # estimate token count atleast roughly
+            if len(texts[i].split()) < 60:
+                results[i] = texts[i]
+                continue
+            chunks = chunk_for_model(texts[i], summarizer, model_name) if SUMMARY_CHUNKING else None
+            if chunks and len(chunks) > 1:
+                chunked[i] = chunks
+            else:
+                whole.append(i)
         
-        for i, sentence in enumerate(sentences):
-            score = len(sentence.split()) * 2  # the base score on length
-            
-            # imp words? BOOST!
-            for word in important_words:
-                if word in sentence.lower():
-                    score += 10
-            
-            if i < 3:
-                score += 5
-            
-            scored_sentences.append((score, sentence))
-        
-        # Sort by score and take top 3-4
-        scored_sentences.sort(reverse=True, key=lambda x: x[0])
-        top_sentences = [s for _, s in scored_sentences[:min(4, len(scored_sentences))]]
-        
-        # same chronology
-        final_sentences = []
-        for orig_sentence in sentences:
-            if orig_sentence in top_sentences and orig_sentence not in final_sentences:
-                final_sentences.append(orig_sentence)
-                if len(final_sentences) >= 3:
-                    break
+        jobs = [_length_job(texts[i], max_len) for i in whole]
+        outputs = _run_summarizer(summarizer, jobs + [_length_job(c, max_len) for i in chunked for c in chunked[i]],
+                                  batch_size)
+        for i, (text, target_max, target_min), summary in zip(whole, jobs, outputs):
+            if summary:
+                results[i] = summary
+                save_summary_to_cache(summary_cache_key(text, model_name, target_max, target_min), summary, model_name)
         
-        summary = '. '.join(final_sentences) + '.'
+        # reduce: join each document's partial summaries and summarize again,
+        # re-chunking (another map round) while they still don't fit
+        partials = _gather_partials(chunked, outputs[len(jobs):])
+        for round_no in range(1, SUMMARY_REDUCE_ROUNDS + 1):
+            if not partials:
+                break
+            finishing, splitting = [], {}
+            for i, joined in partials.items():
+                chunks = chunk_for_model(joined, summarizer, model_name) if round_no < SUMMARY_REDUCE_ROUNDS else None
+                if chunks and len(chunks) > 1:
+                    splitting[i] = chunks
+                else:
+                    finishing.append(i)
+            jobs = [_length_job(partials[i], max_len) for i in finishing]
+            outputs = _run_summarizer(summarizer, jobs + [_length_job(c, max_len) for i in splitting for c in splitting[i]],
+                                      batch_size)
+            for i, summary in zip(finishing, outputs):
+                if summary:
+                    results[i] = summary
+                    save_summary_to_cache(_chunked_key(texts[i], model_name, max_len), summary, model_name)
+            partials = _gather_partials(splitting, outputs[len(jobs):])
+    
+    span['model'] = model_name
+    span['chunked'] = len(chunked) if summarizer and uncached else 0
+    span['extractive'] = sum(1 for i in uncached if results[i] is None)
+    for i in uncached:
+        if results[i] is None:
+            results[i] = extractive_summary(texts[i])
+            if model_name == 'extractive':
+                save_summary_to_cache(_summary_key(texts[i], model_name, max_len), results[i], model_name)
+    
+    return results
+
+def _gather_partials(chunked, outputs):
+    """{doc: chunks} + flat chunk summaries -> {doc: joined partial summaries}"""
+    partials, pos = {}, 0
+    for i, chunks in chunked.items():
+        parts = [p for p in outputs[pos:pos + len(chunks)] if p]
+        pos += len(chunks)
+        if parts:
+            partials[i] = ' '.join(parts)
+    return partials
+
+def _summary_key(text, model_name, max_len):
+    if model_name == 'extractive':
+        return summary_cache_key(text, model_name, max_len, 0)
+    return summary_cache_key(text, model_name, *summary_lengths(len(text.split()), max_len))
+
+def _chunked_key(text, model_name, max_len):
+    """Map-reduce summaries get their own key, a truncated single pass of the same text isn't the same thing"""
+    return summary_cache_key(text, f"{model_name}+chunked", max_len, SUMMARY_CHUNK_TOKENS)
+
+# extractive engine: tf-idf sentence vectors + textrank centrality (numpy if there, plain python if not)
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])["\'”’)]?\s+(?=["\'“‘(]?[A-Z0-9])')
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9'-]*[a-z0-9]")
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further had
+has have having he her here hers herself him himself his how i if in into is it its itself just
+me more most my myself no nor not now of off on once only or other our ours out over own said
+same she should so some such than that the their theirs them then there these they this those
+through to too under until up very was we were what when where which while who whom why will
+with would you your yours says say one two new also like get told according year years
+""".split())
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_ITERATIONS = 50
+TEXTRANK_TOLERANCE = 1e-6
+SUMMARY_REDUNDANCY = 0.5    # cosine above this vs an already picked sentence = same point again
+SUMMARY_LEAD_BONUS = 0.3    # news puts the point up top, early sentences get a nudge
+
+NUMPY_AVAILABLE = _has_module('numpy')
+
+def split_sentences(text):
+    """Sentences with their punctuation kept (25-400 chars, the rest is captions and junk)"""
+    return [s.strip() for s in SENTENCE_SPLIT.split(text) if 25 < len(s.strip()) < 400]
+
+def sentence_tokens(sentence):
+    return [w for w in TOKEN_RE.findall(sentence.lower()) if w not in STOPWORDS]
+
+def textrank(token_lists):
+    """
+    TextRank over tf-idf cosine similarity of the given sentences.
+    Returns (scores, sim) - sim(i, j) is the cosine between two sentences.
+    """
+    n = len(token_lists)
+    if n == 0:
+        return [], lambda i, j: 0.0
+    
+    # sparse tf-idf: sublinear tf, smoothed idf, rows l2 normalized
+    counts = [Counter(tokens) for tokens in token_lists]
+    df = Counter()
+    for c in counts:
+        df.update(c.keys())
+    idf = {term: math.log((1 + n) / (1 + d)) + 1 for term, d in df.items()}
+    rows = []
+    for c in counts:
+        row = {term: (1 + math.log(tf)) * idf[term] for term, tf in c.items()}
+        norm = math.sqrt(sum(w * w for w in row.values())) or 1.0
+        # a term only in this one sentence can't make it similar to anything - drop it after the norm
+        rows.append({term: w / norm for term, w in row.items() if df[term] > 1})
+    
+    if NUMPY_AVAILABLE and lazy_import('numpy') is not None:
+        return _textrank_numpy(rows)
+    return _textrank_python(rows)
+
+def _textrank_numpy(rows):
+    np = lazy_import('numpy')
+    n = len(rows)
+    vocab = {}
+    r_idx, c_idx, vals = [], [], []
+    for i, row in enumerate(rows):
+        for term, w in row.items():
+            r_idx.append(i)
+            c_idx.append(vocab.setdefault(term, len(vocab)))
+            vals.append(w)
+    
+    # only shared terms are left, so this stays small even for a whole topic's worth of sentences
+    matrix = np.zeros((n, max(len(vocab), 1)), dtype=np.float32)
+    if vals:
+        matrix[r_idx, c_idx] = vals
+    sim = matrix @ matrix.T
+    np.fill_diagonal(sim, 0.0)
+    
+    out = sim.sum(axis=1)
+    dangling = out == 0
+    transition = np.divide(sim, out[:, None], out=np.zeros_like(sim), where=~dangling[:, None])
+    transition[dangling] = 1.0 / n
+    
+    scores = np.full(n, 1.0 / n, dtype=np.float32)
+    for _ in range(TEXTRANK_ITERATIONS):
+        updated = (1 - TEXTRANK_DAMPING) / n + TEXTRANK_DAMPING * (scores @ transition)
+        done = np.abs(updated - scores).sum() < TEXTRANK_TOLERANCE
+        scores = updated
+        if done:
+            break
+    return scores.tolist(), lambda i, j: float(sim[i, j])
+
+def _textrank_python(rows):
+    n = len(rows)
+    # inverted index, so only sentence pairs that share a term ever get compared
+    postings = {}
+    for i, row in enumerate(rows):
+        for term, w in row.items():
+            postings.setdefault(term, []).append((i, w))
+    sim = [dict() for _ in range(n)]
+    for entries in postings.values():
+        for a, wa in entries:
+            for b, wb in entries:
+                if a != b:
+                    sim[a][b] = sim[a].get(b, 0.0) + wa * wb
+    
+    out = [sum(s.values()) for s in sim]
+    scores = [1.0 / n] * n
+    for _ in range(TEXTRANK_ITERATIONS):
+        dangling = sum(scores[i] for i in range(n) if not out[i]) / n
+        updated = [(1 - TEXTRANK_DAMPING) / n + TEXTRANK_DAMPING * dangling] * n
+        for i in range(n):
+            if out[i]:
+                share = TEXTRANK_DAMPING * scores[i] / out[i]
+                for j, w in sim[i].items():
+                    updated[j] += share * w
+        done = sum(abs(a - b) for a, b in zip(updated, scores)) < TEXTRANK_TOLERANCE
+        scores = updated
+        if done:
+            break
+    return scores, lambda i, j: sim[i].get(j, 0.0)
+
+def rank_sentences(documents, max_sentences=3, per_document=None):
+    """
+    Pick the most central sentences across one or more documents, skipping ones that
+    repeat an already picked sentence. Returns [(doc, position, sentence)] in reading order.
+    """
+    sentences = []  # (doc, position, sentence, tokens)
+    for d, text in enumerate(documents):
+        for p, sentence in enumerate(split_sentences(text or '')):
+            tokens = sentence_tokens(sentence)
+            if len(tokens) >= 4:
+                sentences.append((d, p, sentence, tokens))
+    if not sentences:
+        return []
+    
+    scores, sim = textrank([s[3] for s in sentences])
+    ranked = sorted(range(len(sentences)),
+                    key=lambda i: -scores[i] * (1 + SUMMARY_LEAD_BONUS / (1 + sentences[i][1])))
+    
+    picked, per_doc = [], Counter()
+    for i in ranked:
+        d = sentences[i][0]
+        if per_document and per_doc[d] >= per_document:
+            continue
+        if any(sim(i, j) > SUMMARY_REDUNDANCY for j in picked):
+            continue
+        picked.append(i)
+        per_doc[d] += 1
+        if len(picked) >= max_sentences:
+            break
+    return [sentences[i][:3] for i in sorted(picked, key=lambda i: sentences[i][:2])]
+
+def extractive_summary(text, max_sentences=3):
+    """No model (or it failed) - the most central sentences, in their original order"""
+    try:
+        picked = rank_sentences([text], max_sentences)
+        summary = ' '.join(sentence for _, _, sentence in picked)
         if len(summary) < 30:
             words = text.split()
             summary = ' '.join(words[:70]) + '...'
-        
         return summary
-        
     except Exception:
         words = text.split()
         return ' '.join(words[:80]) + '...'
 
+def multi_document_summary(texts, max_sentences=6, per_document=2):
+    """Overview without a model: rank every article's sentences together, at most a couple per article"""
+    try:
+        picked = rank_sentences([t for t in texts if t], max_sentences, per_document)
+    except Exception:
+        picked = []
+    return ' '.join(sentence for _, _, sentence in picked)
+
+def _ngrams(tokens, n):
+    return Counter(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+def rouge_scores(candidate, reference):
+    """ROUGE-1/2/L F1 of candidate against reference (plain lowercase word tokens, no stemming)"""
+    cand, ref = TOKEN_RE.findall(candidate.lower()), TOKEN_RE.findall(reference.lower())
+    scores = {}
+    for n in (1, 2):
+        c, r = _ngrams(cand, n), _ngrams(ref, n)
+        overlap = sum((c & r).values())
+        p, rc = overlap / max(sum(c.values()), 1), overlap / max(sum(r.values()), 1)
+        scores[f'rouge{n}'] = 2 * p * rc / (p + rc) if p + rc else 0.0
+    # lcs, one row at a time
+    prev = [0] * (len(ref) + 1)
+    for a in cand:
+        row = [0]
+        for j, b in enumerate(ref):
+            row.append(prev[j] + 1 if a == b else max(prev[j + 1], row[j]))
+        prev = row
+    lcs = prev[-1]
+    p, rc = lcs / max(len(cand), 1), lcs / max(len(ref), 1)
+    scores['rougeL'] = 2 * p * rc / (p + rc) if p + rc else 0.0
+    return scores
+
+def summarizer_bench_main(argv):
+    """scout-agent.py summarizer-bench - latency / throughput / rouge of each backend vs plain torch"""
+    global SUMMARY_CACHE_ENABLED
+    parser = argparse.ArgumentParser(prog='scout-agent.py summarizer-bench',
+                                     description='Compare summarizer backends on the same texts')
+    parser.add_argument('files', nargs='*', help='text files to summarize (default: article text from the cache)')
+    parser.add_argument('--summarizer', choices=[m for m, models in SUMMARIZER_MODELS.items() if models],
+                        default='distilbart')
+    parser.add_argument('--backends', nargs='+', choices=SUMMARIZER_BACKENDS, default=SUMMARIZER_BACKENDS)
+    parser.add_argument('--limit', type=int, default=8, help='texts taken from the cache')
+    parser.add_argument('--batch-size', type=int, default=SUMMARY_BATCH_SIZE)
+    parser.add_argument('--threads', type=int, default=None)
+    parser.add_argument('--interop-threads', type=int, default=None)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+    
+    if args.files:
+        texts = []
+        for path in args.files:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                texts.append(f.read())
+    else:
+        texts = [entry.value for _, entry in get_cache_store().items('text') if entry.value][:args.limit]
+    if not texts:
+        print("[bench] nothing to summarize - pass text files or run a search first to fill the cache")
+        return
+    
+    SUMMARY_CACHE_ENABLED = False  # every backend does the actual work
+    set_inference_threads(args.threads, args.interop_threads)
+    backends = ['torch'] + [b for b in args.backends if b != 'torch']  # torch is the reference
+    results, reference = [], None
+    for backend in backends:
+        set_summarizer_mode(args.summarizer, backend)
+        started = time.perf_counter()
+        if get_summarizer() is None:
+            print(f"[bench] {backend}: no model, skipped")
+            continue
+        load = time.perf_counter() - started
+        summarize_text(texts[0])  # warm up, first call pays for lazy allocations
+        
+        latencies, outputs = [], []
+        for text in texts:
+            started = time.perf_counter()
+            outputs.append(summarize_text(text))
+            latencies.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        summarize_batch(texts, batch_size=args.batch_size)
+        batched = time.perf_counter() - started
+        
+        if reference is None:
+            reference = outputs
+        rouge = [rouge_scores(o or '', r or '') for o, r in zip(outputs, reference)]
+        latencies.sort()
+        results.append({
+            'backend': backend,
+            'model': summarizer_model_name(),
+            'load_s': round(load, 2),
+            'latency_mean_s': round(sum(latencies) / len(latencies), 3),
+            'latency_p50_s': round(latencies[len(latencies) // 2], 3),
+            'throughput_per_s': round(len(texts) / batched, 2) if batched else None,
+            **{k: round(sum(r[k] for r in rouge) / len(rouge), 3) for k in ('rouge1', 'rouge2', 'rougeL')},
+        })
+    
+    if args.json:
+        print(json.dumps({'texts': len(texts), 'results': results}, indent=2))
+        return
+    print(f"{len(texts)} texts, rouge F1 against {results[0]['model'] if results else 'torch'}")
+    print(f"{'model':42s} {'load s':>7s} {'mean s':>7s} {'p50 s':>7s} {'texts/s':>8s} {'R1':>6s} {'R2':>6s} {'RL':>6s}")
+    for r in results:
+        print(f"{r['model'][:42]:42s} {r['load_s']:7.2f} {r['latency_mean_s']:7.3f} {r['latency_p50_s']:7.3f} "
+              f"{r['throughput_per_s'] or 0:8.2f} {r['rouge1']:6.3f} {r['rouge2']:6.3f} {r['rougeL']:6.3f}")
+
 def extract_research_leads(text, count=6):
     """Extract potential research topics from text"""
     if not text:
@@ -738,13 +3020,248 @@ def extract_research_leads(text, count=6):
     
     return '\n'.join(leads) if leads else "No specific leads identified - try a broader search query"
 
+_STOP = object()
+
+class StagedPipeline:
+    """
+    Bounded queues between stages. Every item moves to the next stage as soon
+    as its current stage is done, so network and CPU work overlap.
+    stages = [(name, func, workers)], func(item) -> item, or None to drop it.
+    If func raises, a dict item goes on with status 'failed' (anything else untouched).
+    """
+    
+    def __init__(self, stages, queue_depth=DEFAULT_QUEUE_DEPTH, verbose=False):
+        self.stages = [(name, func, max(1, workers)) for name, func, workers in stages]
+        if isinstance(queue_depth, dict):
+            self.queue_depths = [max(1, queue_depth.get(name, DEFAULT_QUEUE_DEPTH)) for name, _, _ in self.stages]
+        else:
+            self.queue_depths = [max(1, queue_depth)] * len(self.stages)
+        self.verbose = verbose
+    
+    def _worker(self, name, func, in_q, out_q, state, next_workers):
+        while True:
+            item = in_q.get()
+            if item is _STOP:
+                break
+            try:
+                result = func(item)
+            except Exception as e:
+                if self.verbose:
+                    print(f"[pipeline] {name} failed: {type(e).__name__}: {e}")
+                result = item  # pass it on, later stages see it failed
+                if isinstance(item, dict):
+                    item['status'] = 'failed'
+            if result is not None:
+                out_q.put(result)
+        
+        # last worker out tells the next stage to stop
+        with state['lock']:
+            state['alive'] -= 1
+            last = state['alive'] == 0
+        if last:
+            for _ in range(next_workers):
+                out_q.put(_STOP)
+    
+    def run(self, source):
+        """Feed items from source (any iterable), returns finished items in completion order"""
+        queues = [queue.Queue(maxsize=depth) for depth in self.queue_depths]
+        queues.append(queue.Queue())  # collector, never blocks the last stage
+        threads = []
+        
+        for idx, (name, func, workers) in enumerate(self.stages):
+            next_workers = self.stages[idx + 1][2] if idx + 1 < len(self.stages) else 1
+            state = {'lock': threading.Lock(), 'alive': workers}
+            for n in range(workers):
+                t = threading.Thread(
+                    target=self._worker,
+                    args=(name, func, queues[idx], queues[idx + 1], state, next_workers),
+                    name=f"scout-{name}-{n}",
+                    daemon=True
+                )
+                t.start()
+                threads.append(t)
+        
+        def feed():
+            try:
+                for item in source:
+                    queues[0].put(item)
+            except Exception as e:
+                print(f"[pipeline] source failed: {e}")
+            finally:
+                for _ in range(self.stages[0][2]):
+                    queues[0].put(_STOP)
+        
+        feeder = threading.Thread(target=feed, name="scout-source", daemon=True)
+        feeder.start()
+        
+        results = []
+        while True:
+            item = queues[-1].get()
+            if item is _STOP:
+                break
+            results.append(item)
+        
+        feeder.join()
+        for t in threads:
+            t.join()
+        return results
+
+# near-duplicates: the same wire story (AP, Reuters...) shows up under several outlets
+DEDUP_ENABLED = True
+DEDUP_SHINGLE = 3  # words per shingle
+DEDUP_CANDIDATE_BITS = 10  # simhash bits (of 64) apart to be worth a closer look - bylines, footers, headlines move it
+DEDUP_TEXT_OVERLAP = 0.8  # shingle jaccard that confirms two texts are the same story
+DEDUP_TITLE_OVERLAP = 0.75  # headline word jaccard that counts as the same story
+DEDUP_TITLE_MIN_WORDS = 4  # shorter headlines are too generic to match on
+TITLE_SOURCE_SUFFIX = re.compile(r'\s+[-–—|]\s+[^-–—|]{2,60}$')  # google news titles end in " - Outlet"
+
+def shingles(text, size=DEDUP_SHINGLE):
+    words = TOKEN_RE.findall(text.lower())
+    if len(words) < size:
+        return Counter(words)
+    return Counter(' '.join(words[i:i + size]) for i in range(len(words) - size + 1))
+
+def simhash(grams):
+    """64-bit SimHash of a shingle Counter - near-identical texts land a few bits apart"""
+    weights = [0] * 64
+    for gram, count in grams.items():
+        h = int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += count if h >> bit & 1 else -count
+    return sum(1 << bit for bit, w in enumerate(weights) if w > 0)
+
+def headline_words(title):
+    return set(sentence_tokens(TITLE_SOURCE_SUFFIX.sub('', title or '')))
+
+def _jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+def story_fingerprint(record):
+    """(shingle set, simhash, headline words) - text parts are None for snippet-only records"""
+    text = set(shingles(record['content'])) if record.get('extracted') and record.get('content') else None
+    return text, simhash(Counter(text)) if text else None, headline_words(record.get('title'))
+
+def same_story(a, b):
+    """
+    Extracted texts within DEDUP_CANDIDATE_BITS simhash bits get their shingle sets
+    compared (DEDUP_TEXT_OVERLAP); headlines with the outlet suffix dropped match on
+    word overlap (DEDUP_TITLE_OVERLAP) - that's all snippet-only articles have.
+    """
+    if a[1] is not None and b[1] is not None and bin(a[1] ^ b[1]).count('1') <= DEDUP_CANDIDATE_BITS \
+            and _jaccard(a[0], b[0]) >= DEDUP_TEXT_OVERLAP:
+        return True
+    if min(len(a[2]), len(b[2])) >= DEDUP_TITLE_MIN_WORDS:
+        return _jaccard(a[2], b[2]) >= DEDUP_TITLE_OVERLAP
+    return False
+
+def group_near_duplicates(records):
+    """Groups of record indices that are the same story (see same_story), in order of first appearance"""
+    n = len(records)
+    prints = [story_fingerprint(r) for r in records]
+    parent = list(range(n))
+    
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    for i in range(n):
+        for j in range(i + 1, n):
+            if same_story(prints[i], prints[j]):
+                ri, rj = find(i), find(j)
+                parent[max(ri, rj)] = min(ri, rj)
+    
+    groups = {}
+    for i in range(n):
+        groups.setdefault(find(i), []).append(i)
+    return [groups[root] for root in sorted(groups)]
+
+class SharedArticles:
+    """
+    Batch mode memo: url -> (record, status) and article text -> summary, shared by
+    every topic in the process. An article that shows up under several topics is
+    fetched, extracted and summarized once; one that's still in flight is waited on.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._articles = {}  # url -> Future of (record, status)
+        self._summaries = {}  # sha1 of text -> summary
+        self.stats = {'fetched': 0, 'reused': 0, 'summarized': 0, 'summaries_reused': 0}
+    
+    def article(self, url, enrich):
+        """(record, status, reused) - enrich() only runs for the first topic that asks"""
+        with self._lock:
+            future = self._articles.get(url)
+            owner = future is None
+            if owner:
+                future = self._articles[url] = Future()
+                self.stats['fetched'] += 1
+            else:
+                self.stats['reused'] += 1
+        if not owner:
+            record, status = future.result()
+            return record, status, True
+        try:
+            result = enrich()
+        except BaseException as e:
+            future.set_exception(e)
+            with self._lock:
+                self._articles.pop(url, None)  # let the next topic try again
+            raise
+        future.set_result(result)
+        return result[0], result[1], False
+    
+    def summarize(self, texts, summarize):
+        """summarize(texts) -> summaries, only called with texts no earlier topic summarized"""
+        keys = [hashlib.sha1((t or '').encode('utf-8', errors='ignore')).hexdigest() for t in texts]
+        with self._lock:
+            missing = [i for i, k in enumerate(keys) if k not in self._summaries]
+            self.stats['summaries_reused'] += len(texts) - len(missing)
+        if missing:
+            fresh = summarize([texts[i] for i in missing])
+            with self._lock:
+                for i, summary in zip(missing, fresh):
+                    self._summaries[keys[i]] = summary
+                self.stats['summarized'] += len(missing)
+        with self._lock:
+            return [self._summaries.get(k) for k in keys]
+
+STATUS_MARKS = {
+    'paywall': " :skull:(paywall)",
+    'success': " ",
+    'failed': " =!"
+}
+DELTA_MARKS = {'new': "[NEW] ", 'changed': "[UPDATED] "}
+
 #THE UPDATE!!!
 class ScoutAgent:
-    def __init__(self, topic, days_back=7, verbose=False, max_articles=12):
+    def __init__(self, topic, days_back=7, verbose=False, max_articles=12, workers=1,
+                 pipeline=False, queue_depth=DEFAULT_QUEUE_DEPTH, stage_workers=None,
+                 summary_batch_size=SUMMARY_BATCH_SIZE, reextract=False, shared=None, report_file=None,
+                 incremental=False):
         self.topic = topic
         self.days_back = days_back
         self.verbose = verbose
         self.max_articles = max_articles
+        self.workers = max(1, workers)
+        self.pipeline = pipeline
+        self.queue_depth = queue_depth
+        self.summary_batch_size = max(1, summary_batch_size)
+        self.reextract = reextract
+        self.shared = shared  # SharedArticles in batch mode
+        self.report_file = report_file
+        self.incremental = incremental and not reextract
+        self.delta = {'new': 0, 'changed': 0, 'unchanged': 0}
+        self._streamed = set()  # urls already written to --jsonl
+        self.stage_workers = dict(DEFAULT_STAGE_WORKERS)
+        if stage_workers:
+            self.stage_workers.update({k: v for k, v in stage_workers.items() if v})
+        if EXTRACTION_POOL is not None:
+            # each thread waits on one worker process, fewer threads than processes leaves the rest idle
+            self.workers = max(self.workers, EXTRACTION_POOL.processes)
+            self.stage_workers['extract'] = max(self.stage_workers['extract'], EXTRACTION_POOL.processes)
         self.articles = []
         self.summaries = []
         self.stats = {
@@ -752,7 +3269,12 @@ class ScoutAgent:
             'decoded': 0, 
             'extracted': 0, 
             'failed': 0,
-            'blacklisted': 0
+            'blacklisted': 0,
+            'duplicates': 0,
+            # this run's own cache use - the module-wide counters include every other job in the process
+            'decode_cache_hits': 0,
+            'decode_cache_misses': 0,
+            'summary_cache_hits': 0
         }
     
     def log(self, msg):
@@ -760,18 +3282,387 @@ class ScoutAgent:
             timestamp = datetime.now().strftime('%H:%M:%S')
             print(f"[{timestamp}] {msg}")
     
+    def _enrich_article(self, article, throttle=None):
+        """Fetch one article, returns (record, status) - status is paywall/success/failed"""
+        if self.shared is None or self.reextract:
+            return self._enrich_one(article, throttle)
+        record, status, reused = self.shared.article(article['url'], lambda: self._enrich_one(article, throttle))
+        if reused:
+            # same page another topic already did, under this feed's headline
+            record = dict(record, title=article['title'], reused=True)
+        return record, status
+    
+    def _enrich_one(self, article, throttle=None):
+        url = article['url']
+        domain = urlparse(url).netloc.replace('www.', '') if url else 'unknown'
+        
+        # check if domain is blacklisted if it is I SWEAR!!
+        if any(blacklisted in domain.lower() for blacklisted in BLACKLIST_DOMAINS):
+            return {
+                'title': article['title'],
+                'url': url,
+                'content': article['snippet'],
+                'extracted': False,
+                'reason': 'paywall'
+            }, 'paywall'
+        
+        with TRACER.span('article', url=url) as span:
+            if self.reextract:
+                content = reextract_article(url, self.verbose)
+            else:
+                content = extract_article_text_multi(url, self.verbose, throttle)
+            span['chars'] = len(content or '')
+        
+        if content and len(content) > 300:
+            return {
+                'title': article['title'],
+                'url': url,
+                'content': content,
+                'extracted': True,
+                'reason': 'success'
+            }, 'success'
+        
+        return {
+            'title': article['title'],
+            'url': url,
+            'content': article['snippet'],
+            'extracted': False,
+            'reason': 'extraction_failed'
+        }, 'failed'
+    
+    def _count(self, status):
+        if status == 'paywall':
+            self.stats['blacklisted'] += 1
+        elif status == 'success':
+            self.stats['extracted'] += 1
+        else:
+            self.stats['failed'] += 1
+    
+    def _extract_sequential(self, articles):
+        enriched = []
+        
+        for i, article in enumerate(articles, 1):
+            url = article['url']
+            domain = urlparse(url).netloc.replace('www.', '') if url else 'unknown'
+            
+            print(f"  [{i:2d}/{len(articles):2d}] {domain[:25]:25s}", end='', flush=True)
+            
+            if self.verbose:
+                print()
+                self.log(f"Processing: {url}")
+            
+            record, status = self._enrich_article(article)
+            self._count(status)
+            enriched.append(record)
+            print(STATUS_MARKS[status])
+            
+            if status == 'paywall' or self.reextract or record.get('reused'):
+                continue  # no request was made
+            
+            # Random delay between requests
+            delay = random.uniform(RATE_LIMIT_DELAY * 0.8, RATE_LIMIT_DELAY * 1.2)
+            time.sleep(delay)
+        
+        return enriched
+    
+    def _extract_concurrent(self, articles):
+        """Spread the URLs over a thread pool, politeness is per host now"""
+        throttle = HostThrottle()
+        total = len(articles)
+        enriched = [None] * total
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(self._enrich_article, article, throttle): i
+                for i, article in enumerate(articles)
+            }
+            done = 0
+            for future in as_completed(futures):
+                i = futures[future]
+                article = articles[i]
+                try:
+                    record, status = future.result()
+                except Exception as e:
+                    self.log(f"worker crashed on {article['url']}: {e}")
+                    record = {
+                        'title': article['title'],
+                        'url': article['url'],
+                        'content': article['snippet'],
+                        'extracted': False,
+                        'reason': 'extraction_failed'
+                    }
+                    status = 'failed'
+                
+                self._count(status)
+                enriched[i] = record  # keep RSS order
+                done += 1
+                domain = urlparse(record['url']).netloc.replace('www.', '') if record['url'] else 'unknown'
+                print(f"  [{done:2d}/{total:2d}] {domain[:25]:25s}{STATUS_MARKS[status]}")
+        get_cache_store().release_threads()
+        
+        return enriched
+    
+    def _stage_fetch(self, item):
+        article = item['article']
+        url = article['url']
+        domain = urlparse(url).netloc.replace('www.', '') if url else 'unknown'
+        
+        if any(blacklisted in domain.lower() for blacklisted in BLACKLIST_DOMAINS):
+            item['status'] = 'paywall'
+            return item
+        if not url or 'google.com' in url:
+            item['status'] = 'failed'
+            return item
+        
+        with TRACER.span('fetch', url=url, cache='miss'):
+            cached, fetched = fetch_or_revalidate(url, self.verbose, self._throttle)
+        if cached:
+            item['content'] = cached
+            item['status'] = 'success'
+        elif fetched:
+            item['html'] = fetched.html
+            item['headers'] = fetched.headers
+        else:
+            item['status'] = 'failed'
+        return item
+    
+    def _stage_extract(self, item):
+        if item.get('html'):
+            try:
+                content = extract_text_from_html(item['article']['url'], item.pop('html'), self.verbose,
+                                                 item.pop('headers', None))
+            except Exception as e:
+                self.log(f"Extraction crashed: {type(e).__name__}: {e}")
+                content = None
+            item['status'] = 'success' if content and len(content) > 300 else 'failed'
+            if item['status'] == 'success':
+                item['content'] = content
+        
+        article = item['article']
+        if item['status'] == 'success':
+            item['record'] = {
+                'title': article['title'],
+                'url': article['url'],
+                'content': item['content'],
+                'extracted': True,
+                'reason': 'success'
+            }
+        else:
+            item['record'] = {
+                'title': article['title'],
+                'url': article['url'],
+                'content': article['snippet'],
+                'extracted': False,
+                'reason': 'paywall' if item['status'] == 'paywall' else 'extraction_failed'
+            }
+        
+        domain = urlparse(article['url']).netloc.replace('www.', '') if article['url'] else 'unknown'
+        with self._print_lock:
+            self._count(item['status'])
+            self._done += 1
+            print(f"  [{self._done:2d}] {domain[:25]:25s}{STATUS_MARKS[item['status']]}")
+        return item
+    
+    def _same_story_seen(self, item):
+        """Pipeline dedup gate: is this item a story an earlier item already brought? Groups are kept for the report"""
+        fingerprint = story_fingerprint(item['record'])
+        with self._story_lock:
+            for index, seen in self._fingerprints:
+                if same_story(fingerprint, seen):
+                    self._story_of[item['index']] = self._story_of[index]
+                    return True
+            self._fingerprints.append((item['index'], fingerprint))
+            self._story_of[item['index']] = item['index']
+            return False
+    
+    def _stage_summarize(self, item):
+        if DEDUP_ENABLED and self._same_story_seen(item):
+            return item  # another copy of a story already through, that one gets the summary
+        if item['index'] < MAX_SUMMARIES:
+            self.log(f"Summarizing: {item['record']['title'][:60]}...")
+            item['summary'] = summarize_text(item['record']['content'], stats=self.stats)
+            item.pop('content', None)  # the record has it, --jsonl writes it out once copies are folded
+        return item
+    
+    def _released(self, record):
+        """Record minus its body - the extractive overview still gets a few central sentences, a model needs none"""
+        keep = ''
+        if record['content'] and summarizer_model_name() == 'extractive':
+            keep = extractive_summary(record['content'], STREAM_EXCERPT_SENTENCES)
+        return dict(record, content=keep)  # copy, batch mode shares records
+    
+    def _emit(self, record, summary):
+        """--jsonl: write the article out as soon as its summary exists, then let go of the body"""
+        if RESULT_STREAM is None or record['url'] in self._streamed:
+            return record
+        self._streamed.add(record['url'])
+        RESULT_STREAM.write('article', topic=self.topic, title=record['title'], url=record['url'],
+                            summary=summary, extracted=record['extracted'], reason=record.get('reason', 'unknown'),
+                            chars=len(record['content'] or ''), also=record.get('duplicates', []),
+                            delta=record.get('delta'))
+        return self._released(record)
+    
+    def _reuse_known(self, state):
+        """--incremental: index -> record for articles the last run saw and checked recently, no fetch needed"""
+        known = (state or {}).get('articles', {})
+        reused = {}
+        for i, article in enumerate(self.articles):
+            prev = known.get(article['url'])
+            if not prev or time.time() - prev.get('checked', 0) > INCREMENTAL_RECHECK:
+                continue
+            content = load_from_cache(article['url']) if prev['extracted'] else article['snippet']
+            if not content:
+                continue  # text cache lost it, fetch again
+            reused[i] = {
+                'title': article['title'],
+                'url': article['url'],
+                'content': content,
+                'extracted': prev['extracted'],
+                'reason': prev['reason'],
+                'checked': prev['checked']
+            }
+            self._count({'success': 'success', 'paywall': 'paywall'}.get(prev['reason'], 'failed'))
+        return reused
+    
+    def _mark_delta(self, enriched, state, precomputed):
+        """Tag records new/changed/unchanged against the last run, unchanged ones keep their summary"""
+        known = (state or {}).get('articles', {})
+        same_model = (state or {}).get('model') == summarizer_model_name()
+        marked = []
+        for i, record in enumerate(enriched):
+            h = content_hash(record['content'])
+            prev = known.get(record['url'])
+            if prev is None:
+                delta = 'new'
+            elif prev['hash'] == h:
+                delta = 'unchanged'
+                if same_model and prev.get('summary') and i not in precomputed:
+                    precomputed[i] = prev['summary']
+            else:
+                delta = 'changed'
+            self.delta[delta] += 1
+            marked.append(dict(record, delta=delta, hash=h))  # copy, batch mode shares records
+        return marked
+    
+    def _next_state(self, state, marked, overview, next_steps):
+        """What the next --incremental run compares against - every record seen, folded copies included"""
+        now = time.time()
+        articles = {url: prev for url, prev in (state or {}).get('articles', {}).items()
+                    if now - prev.get('seen', 0) < TOPIC_STATE_TTL}
+        summaries = {s['url']: s['summary'] for s in self.summaries}
+        for record in marked:
+            prev = articles.get(record['url'], {})
+            articles[record['url']] = {
+                'title': record['title'],
+                'hash': record['hash'],
+                'summary': summaries.get(record['url'], prev.get('summary') if record['delta'] == 'unchanged' else None),
+                'extracted': record['extracted'],
+                'reason': record.get('reason', 'unknown'),
+                'first_seen': prev.get('first_seen', now),
+                'seen': now,
+                'checked': record.get('checked', now)
+            }
+        return {'updated': now, 'model': summarizer_model_name(), 'overview': overview,
+                'next_steps': next_steps, 'articles': articles}
+    
+    def _collapse_duplicates(self, enriched, precomputed, groups=None):
+        """
+        One record per story: a copy that already has its summary stands in, else the best one
+        (full text, longest), the others are listed under it. groups: from the pipeline's gate
+        """
+        if groups is None:
+            groups = group_near_duplicates(enriched)
+        kept, summaries = [], {}
+        for group in groups:
+            best = max(group, key=lambda i: (i in precomputed, enriched[i]['extracted'],
+                                             len(enriched[i]['content'] or ''), -i))
+            record = enriched[best]
+            if len(group) > 1:
+                # copy - in batch mode the record is shared with other topics
+                record = dict(record, duplicates=[{'title': enriched[i]['title'], 'url': enriched[i]['url']}
+                                                  for i in group if i != best])
+                self.log(f"Same story x{len(group)}: {record['title'][:60]}")
+            if best in precomputed:
+                summaries[len(kept)] = precomputed[best]
+            kept.append(record)
+        self.stats['duplicates'] = len(enriched) - len(kept)
+        return kept, summaries
+    
+    def _run_pipeline(self):
+        """search -> fetch -> extract -> summarize, all stages running at once"""
+        self._throttle = HostThrottle()
+        self._print_lock = threading.Lock()
+        self._story_lock = threading.Lock()
+        self._fingerprints, self._story_of = [], {}  # index -> index of the first copy of its story
+        self._done = 0
+        found = []
+        
+        def source():
+            self.log("Searching Google News RSS...")
+            for i, article in enumerate(iter_search_news(self.topic, self.days_back, self.max_articles, self.stats)):
+                found.append(article)
+                yield {'index': i, 'article': article, 'status': None}
+        
+        runner = StagedPipeline([
+            ('fetch', self._stage_fetch, self.stage_workers['fetch']),
+            ('extract', self._stage_extract, self.stage_workers['extract']),
+            ('summarize', self._stage_summarize, self.stage_workers['summarize']),
+        ], queue_depth=self.queue_depth, verbose=self.verbose)
+        
+        items = sorted(runner.run(source()), key=lambda it: it['index'])
+        get_cache_store().release_threads()
+        self.articles = found
+        if found:
+            save_topic_articles(self.topic, self.days_back, found)
+        enriched = [it['record'] for it in items]
+        summaries = {it['index']: it['summary'] for it in items if 'summary' in it}
+        groups = {}
+        for it in items:
+            groups.setdefault(self._story_of.get(it['index'], it['index']), []).append(it['index'])
+        self._pipeline_groups = sorted(groups.values(), key=min) if DEDUP_ENABLED else None
+        return enriched, summaries
+    
     def run(self):
         print(f"\n🔍 SCOUT AGENT v1.5")
         print(f"Topic: {self.topic}")
         print(f"Timeframe: Last {self.days_back} days")
         print(f"Max articles: {self.max_articles}")
-        print(f"Summarizer: {'ML (if GPU)' if SUMMARIZER else 'Basic extract'}")
+        if self.workers > 1:
+            print(f"Workers: {self.workers}")
+        if SUMMARIZER_MODELS[SUMMARIZER_MODE] and TRANSFORMERS_AVAILABLE:
+            print(f"Summarizer: {SUMMARIZER_MODE} (ML, loads on first summary)")
+        else:
+            print(f"Summarizer: {'none' if SUMMARIZER_MODE == 'none' else 'Basic extract'}")
         print(f"Extractors: {sum([TRAFILATURA_AVAILABLE, NEWSPAPER_AVAILABLE, READABILITY_AVAILABLE])} available")
         print("-" * 50)
         
-        # find it!
-        self.log("Searching Google News RSS...")
-        self.articles = search_news(self.topic, self.days_back, self.max_articles)
+        precomputed = {}
+        self._pipeline_groups = None
+        if self.incremental and self.pipeline:
+            print(" --pipeline is ignored with --incremental, known articles skip the fetch stage entirely")
+            self.pipeline = False
+        if self.reextract:
+            print(" Re-extracting from cached html (offline)...")
+            self.articles = load_topic_articles(self.topic, self.days_back) or []
+            if not self.articles:
+                print(" Nothing cached for this topic yet - run it once online first")
+                return None
+        elif self.pipeline:
+            sw = self.stage_workers
+            print(f" Pipeline: fetch x{sw['fetch']}, extract x{sw['extract']}, "
+                  f"summarize x{sw['summarize']} (queue depth {self.queue_depth})")
+            print("\n Searching + extracting + summarizing...")
+            with TRACER.span('stage.pipeline', topic=self.topic):
+                enriched, precomputed = self._run_pipeline()
+        else:
+            # find it!
+            self.log("Searching Google News RSS...")
+            with TRACER.span('stage.search', topic=self.topic) as span:
+                self.articles = search_news(self.topic, self.days_back, self.max_articles, self.stats)
+                span['articles'] = len(self.articles)
+            if self.articles:
+                save_topic_articles(self.topic, self.days_back, self.articles)
+        
         self.stats['found'] = len(self.articles)
         self.stats['decoded'] = sum(1 for a in self.articles if a.get('decoded', False))
         
@@ -785,60 +3676,34 @@ class ScoutAgent:
         print(f" Found {len(self.articles)} articles")
         if self.stats['decoded'] > 0:
             print(f"   ({self.stats['decoded']} URLs decoded from Google News redirects)")
+        if self.stats['decode_cache_hits']:
+            print(f"   (decode cache: {self.stats['decode_cache_hits']} hits, {self.stats['decode_cache_misses']} misses)")
         
-        # again skadoosh content!
-        print("\n Extracting article content...")
-        enriched = []
-        
-        for i, article in enumerate(self.articles, 1):
-            url = article['url']
-            domain = urlparse(url).netloc.replace('www.', '') if url else 'unknown'
-            
-            print(f"  [{i:2d}/{len(self.articles):2d}] {domain[:25]:25s}", end='', flush=True)
-            
-            if self.verbose:
-                print()
-                self.log(f"Processing: {url}")
-            
-            # check if domain is blacklisted if it is I SWEAR!!
-            if any(blacklisted in domain.lower() for blacklisted in BLACKLIST_DOMAINS):
-                self.stats['blacklisted'] += 1
-                print(" :skull:(paywall)")
-                enriched.append({
-                    'title': article['title'],
-                    'url': url,
-                    'content': article['snippet'],
-                    'extracted': False,
-                    'reason': 'paywall'
-                })
-                continue
-            
-            content = extract_article_text_multi(url, self.verbose)
-            
-            if content and len(content) > 300:
-                self.stats['extracted'] += 1
-                print(" ")
-                enriched.append({
-                    'title': article['title'],
-                    'url': url,
-                    'content': content,
-                    'extracted': True,
-                    'reason': 'success'
-                })
+        state, reused = None, {}
+        if self.incremental:
+            state = load_topic_state(self.topic, self.days_back)
+            reused = self._reuse_known(state)
+            if state:
+                last = datetime.fromtimestamp(state['updated']).strftime('%Y-%m-%d %H:%M')
+                print(f"   Incremental: {len(reused)} known articles reused, "
+                      f"{len(self.articles) - len(reused)} to fetch (last run {last})")
             else:
-                self.stats['failed'] += 1
-                print(" =!")
-                enriched.append({
-                    'title': article['title'],
-                    'url': url,
-                    'content': article['snippet'],
-                    'extracted': False,
-                    'reason': 'extraction_failed'
-                })
-            
-            # Random delay between requests
-            delay = random.uniform(RATE_LIMIT_DELAY * 0.8, RATE_LIMIT_DELAY * 1.2)
-            time.sleep(delay)
+                print("   Incremental: no earlier run of this topic, doing all of it")
+        
+        if not self.pipeline or self.reextract:
+            # again skadoosh content!
+            todo = [a for i, a in enumerate(self.articles) if i not in reused]
+            with TRACER.span('stage.extract', articles=len(todo), workers=self.workers):
+                if not todo:
+                    fetched = []
+                elif self.workers > 1:
+                    print(f"\n Extracting article content ({self.workers} workers)...")
+                    fetched = self._extract_concurrent(todo)
+                else:
+                    print("\n Extracting article content...")
+                    fetched = self._extract_sequential(todo)
+            fetched = iter(fetched)
+            enriched = [reused[i] if i in reused else next(fetched) for i in range(len(self.articles))]
         
         # Statistics
         total_attempted = self.stats['extracted'] + self.stats['failed']
@@ -847,11 +3712,19 @@ class ScoutAgent:
         else:
             success_rate = 0
         
+        DOMAIN_EXTRACTOR_STATS.flush()
         print(f"\n Extraction results:")
         print(f"   Successful: {self.stats['extracted']}/{total_attempted} ({success_rate:.1f}%)")
         print(f"   Failed: {self.stats['failed']}")
         if self.stats['blacklisted'] > 0:
             print(f"   Skipped (paywalls): {self.stats['blacklisted']}")
+        if HTTP_CLIENT is not None:
+            print(f"   HTTP: {format_http_metrics(HTTP_CLIENT.metrics())}")
+        if EXTRACTOR_STATS:
+            print(f"   Extractor CPU: {format_extractor_stats()}")
+        if EXTRACTION_POOL is not None and (EXTRACTION_POOL.stats['timeouts'] or EXTRACTION_POOL.stats['crashes']):
+            print(f"   Killed workers: {EXTRACTION_POOL.stats['timeouts']} timeouts, "
+                  f"{EXTRACTION_POOL.stats['crashes']} crashes (replaced)")
         
         if self.stats['extracted'] == 0:
             print("\n⚠ Warning: No full articles extracted.")
@@ -862,27 +3735,88 @@ class ScoutAgent:
             print("  • Anti-bot protection")
             print("\n  Using available snippets instead...")
         
+        marked = None
+        if self.incremental:
+            enriched = marked = self._mark_delta(enriched, state, precomputed)
+            print(f"   Since last run: {self.delta['new']} new, {self.delta['changed']} changed, "
+                  f"{self.delta['unchanged']} unchanged")
+        
+        if DEDUP_ENABLED and len(enriched) > 1:
+            with TRACER.span('stage.dedup', articles=len(enriched)) as span:
+                enriched, precomputed = self._collapse_duplicates(enriched, precomputed, self._pipeline_groups)
+                span['duplicates'] = self.stats['duplicates']
+            if self.stats['duplicates']:
+                print(f"   Near-duplicates: {self.stats['duplicates']} copies folded into "
+                      f"{sum(1 for r in enriched if r.get('duplicates'))} stories")
+        
         # Generate summaries
         print("\n Generating summaries...")
         all_summaries_text = []
         
-        for i, article in enumerate(enriched[:10], 1):  # Limit to 10 for speed
-            self.log(f"Summarizing: {article['title'][:60]}...")
-            summary = summarize_text(article['content'])
+        pending = [i for i in range(min(len(enriched), MAX_SUMMARIES)) if i not in precomputed]
+        if RESULT_STREAM is not None:
+            # copies are folded by now, so only report records go out (with their 'also');
+            # what's summarized already goes now, bodies past the summary limit aren't needed at all
+            for i in range(len(enriched)):
+                if i >= MAX_SUMMARIES:
+                    enriched[i] = self._released(enriched[i])
+                elif i in precomputed:
+                    enriched[i] = self._emit(enriched[i], precomputed[i])
+        if pending:
+            self.log(f"Summarizing {len(pending)} articles (batch size {self.summary_batch_size})...")
+            # streaming goes one batch at a time so every article is written the moment it's done
+            step = self.summary_batch_size if RESULT_STREAM is not None else len(pending)
+            with TRACER.span('stage.summarize', articles=len(pending)):
+                for start in range(0, len(pending), step):
+                    chunk = pending[start:start + step]
+                    texts = [enriched[i]['content'] for i in chunk]
+                    if self.shared is not None:
+                        batch = self.shared.summarize(texts, lambda todo: summarize_batch(todo, batch_size=self.summary_batch_size, stats=self.stats))
+                    else:
+                        batch = summarize_batch(texts, batch_size=self.summary_batch_size, stats=self.stats)
+                    precomputed.update(zip(chunk, batch))
+                    for i, summary in zip(chunk, batch):
+                        enriched[i] = self._emit(enriched[i], summary)
+        
+        for i, article in enumerate(enriched[:MAX_SUMMARIES]):
+            summary = precomputed[i]
             
             self.summaries.append({
                 'title': article['title'],
                 'url': article['url'],
                 'summary': summary,
                 'extracted': article['extracted'],
-                'reason': article.get('reason', 'unknown')
+                'reason': article.get('reason', 'unknown'),
+                'also': article.get('duplicates', []),
+                'delta': article.get('delta')
             })
             all_summaries_text.append(summary)
         
+        if self.stats['summary_cache_hits']:
+            print(f"   ({self.stats['summary_cache_hits']} summaries from cache, inference skipped)")
+        
         # Create overview
         print("Creating overview...")
         combined = ' '.join(all_summaries_text)
-        overview = summarize_text(combined, 250) if combined else "Unable to generate overview from available content."
+        overview = None
+        previous = state.get('overview') if state and state.get('model') == summarizer_model_name() else None
+        fresh = [s['summary'] for s in self.summaries if s['delta'] != 'unchanged']
+        with TRACER.span('stage.overview'):
+            if self.incremental and previous and not fresh:
+                overview = previous  # nothing new since last run
+                print("   (no new articles, overview kept from last run)")
+            elif self.incremental and previous:
+                # fold the new stories into the last overview instead of redoing all of them
+                if summarizer_model_name() == 'extractive':
+                    overview = multi_document_summary([previous] + [a['content'] for a in enriched[:MAX_SUMMARIES]
+                                                                    if a['delta'] != 'unchanged'])
+                if not overview:
+                    overview = summarize_text(previous + ' ' + ' '.join(fresh), 250, stats=self.stats)
+            elif combined and summarizer_model_name() == 'extractive':
+                # no model - rank the articles' own sentences together rather than re-squeezing the summaries
+                overview = multi_document_summary([a['content'] for a in enriched[:MAX_SUMMARIES]])
+            if not overview:
+                overview = summarize_text(combined, 250, stats=self.stats) if combined else "Unable to generate overview from available content."
         
         # Extract research leads
         print("Identifying research leads...")
@@ -912,7 +3846,7 @@ class ScoutAgent:
         
         # Save full report
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_file = f"scout_report_{timestamp}.txt"
+        report_file = self.report_file or f"scout_report_{timestamp}.txt"
         
         try:
             with open(report_file, 'w', encoding='utf-8') as f:
@@ -921,6 +3855,11 @@ class ScoutAgent:
                 f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write(f"Articles found: {self.stats['found']}\n")
                 f.write(f"Successfully extracted: {self.stats['extracted']}\n")
+                if self.stats['duplicates']:
+                    f.write(f"Duplicate copies folded: {self.stats['duplicates']}\n")
+                if self.incremental:
+                    f.write(f"Since last run: {self.delta['new']} new, {self.delta['changed']} updated, "
+                            f"{self.delta['unchanged']} unchanged\n")
                 f.write(f"Success rate: {success_rate:.1f}%\n")
                 f.write(f"\n{'='*60}\n\n")
                 f.write("OVERVIEW:\n")
@@ -930,9 +3869,13 @@ class ScoutAgent:
                 
                 for i, item in enumerate(self.summaries, 1):
                     status = "FULL TEXT" if item['extracted'] else "SNIPPET ONLY"
-                    f.write(f"{i}. {item['title']}\n")
+                    mark = DELTA_MARKS.get(item['delta'], '') if self.incremental else ''
+                    f.write(f"{i}. {mark}{item['title']}\n")
                     f.write(f"   URL: {item['url']}\n")
                     f.write(f"   STATUS: {status}\n")
+                    for other in item['also']:
+                        domain = urlparse(other['url']).netloc.replace('www.', '') if other['url'] else 'unknown'
+                        f.write(f"   ALSO: {domain} - {other['url']}\n")
                     f.write(f"   SUMMARY: {item['summary']}\n\n")
                 
                 f.write(f"{'='*60}\n\n")
@@ -945,16 +3888,769 @@ class ScoutAgent:
         except Exception as e:
             print(f" Failed to save report: {e}")
         
+        if self.incremental:
+            save_topic_state(self.topic, self.days_back, self._next_state(state, marked, overview, next_steps))
+        if RESULT_STREAM is not None:
+            RESULT_STREAM.write('topic', topic=self.topic, overview=overview, next_steps=next_steps,
+                                stats=self.stats, delta=dict(self.delta) if self.incremental else None,
+                                order=[s['url'] for s in self.summaries], report_file=report_file)
+        
         return {
             'topic': self.topic,
             'stats': self.stats,
+            'delta': dict(self.delta) if self.incremental else None,
             'summaries': self.summaries,
             'overview': overview,
             'next_steps': next_steps,
             'report_file': report_file if 'report_file' in locals() else None
         }
 
+# offline benchmark: fixture feeds + pages served locally, nothing leaves the machine
+BENCH_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench')
+BENCH_FIXTURES = os.path.join(BENCH_DIR, 'fixtures')
+BENCH_RESULTS = os.path.join(BENCH_DIR, 'results')
+
+def bench_hosts(fixtures=BENCH_FIXTURES):
+    """Every publisher host the fixture feeds link to (they all get pointed at the local server)"""
+    hosts = {'news.google.com'}
+    feeds = os.path.join(fixtures, 'feeds')
+    for name in os.listdir(feeds):
+        with open(os.path.join(feeds, name), 'r', encoding='utf-8') as f:
+            feed = f.read()
+        hosts.update(re.findall(r'https?://([a-z0-9.-]+\.bench\.invalid)', feed))
+        # google-style links carry the real url inside the article id
+        for encoded in re.findall(r'news\.google\.com/rss/articles/CBMi([\w-]+)', feed):
+            decoded = base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)).decode('utf-8', errors='ignore')
+            hosts.update(re.findall(r'https?://([a-z0-9.-]+\.bench\.invalid)', decoded))
+    return sorted(hosts)
+
+class BenchServer:
+    """
+    Local stand-in for Google News and the publishers: serves bench/fixtures with
+    injected latency, 503s and connection resets. Pages take query flags -
+    repeat=N (body N times over), status=403, type=application/pdf, charset=latin-1.
+    """
+    
+    def __init__(self, fixtures=BENCH_FIXTURES, latency=0.0, jitter=0.0, error_rate=0.0, reset_rate=0.0, seed=0):
+        self.fixtures = fixtures
+        self.latency, self.jitter = latency, jitter
+        self.error_rate, self.reset_rate = error_rate, reset_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'not_modified': 0, 'errors_injected': 0, 'resets_injected': 0,
+                      'not_found': 0, 'bytes': 0}
+        self.httpd = None
+        self.url = None
+    
+    def _count(self, key, n=1):
+        with self._lock:
+            self.stats[key] += n
+    
+    def _roll(self):
+        with self._lock:
+            return self._random.random(), self._random.random(), self._random.random()
+    
+    def respond(self, method, path):
+        """(status, headers, body) for a request, or None to drop the connection"""
+        self._count('requests')
+        delay_roll, error_roll, reset_roll = self._roll()
+        time.sleep(self.latency + self.jitter * delay_roll)
+        if reset_roll < self.reset_rate:
+            self._count('resets_injected')
+            return None
+        if error_roll < self.error_rate:
+            self._count('errors_injected')
+            return 503, {'Content-Type': 'text/plain', 'Retry-After': '1'}, b'injected failure'
+        
+        parsed = urlparse(path)
+        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        status, content_type, charset = 200, 'text/html', 'utf-8'
+        if parsed.path == '/rss/search':
+            topic = re.sub(r'\s+when:\S+$', '', params.get('q', '')).strip().lower()
+            feed = os.path.join(self.fixtures, 'feeds', re.sub(r'\s+', '-', topic) + '.xml')
+            if os.path.exists(feed):
+                with open(feed, 'rb') as f:
+                    body = f.read()
+            else:
+                body = b'<?xml version="1.0"?><rss version="2.0"><channel><title>empty</title></channel></rss>'
+            content_type = 'application/rss+xml'
+        elif parsed.path.startswith('/pages/'):
+            page = os.path.join(self.fixtures, 'pages', os.path.basename(parsed.path))
+            if not os.path.exists(page):
+                self._count('not_found')
+                return 404, {'Content-Type': 'text/html'}, b'<html><body>not found</body></html>'
+            with open(page, 'rb') as f:
+                body = f.read()
+            repeat = int(params.get('repeat', 1))
+            if repeat > 1 and b'<body>' in body and b'</body>' in body:
+                head, rest = body.split(b'<body>', 1)
+                inner, tail = rest.rsplit(b'</body>', 1)
+                body = head + b'<body>' + inner * repeat + b'</body>' + tail
+            status = int(params.get('status', 200))
+            content_type = params.get('type', content_type)
+            charset = params.get('charset', charset)
+        else:
+            self._count('not_found')
+            return 404, {'Content-Type': 'text/plain'}, b'not found'
+        
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        headers = {'Content-Type': f"{content_type}; charset={charset}", 'ETag': etag,
+                   'Last-Modified': 'Mon, 12 Oct 2026 00:00:00 GMT'}
+        return status, headers, body
+    
+    def start(self):
+        import http.server
+        bench = self
+        
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, like the real sites
+            
+            def _serve(self, send_body):
+                answer = bench.respond(self.command, self.path)
+                if answer is None:
+                    self.close_connection = True
+                    return
+                status, headers, body = answer
+                if status == 200 and self.headers.get('If-None-Match') == headers.get('ETag'):
+                    bench._count('not_modified')
+                    status, body = 304, b''
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if send_body and body:
+                    self.wfile.write(body)
+                    bench._count('bytes', len(body))
+            
+            def do_GET(self):
+                self._serve(True)
+            
+            def do_HEAD(self):
+                self._serve(False)
+            
+            def log_message(self, *args):
+                pass
+        
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, name='bench-server', daemon=True).start()
+        return self
+    
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+def latency_summary(seconds):
+    """count / mean / p50 / p90 / p99 / max, in ms"""
+    if not seconds:
+        return {'count': 0}
+    ordered = sorted(seconds)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+    return {'count': len(ordered), 'mean_ms': round(sum(ordered) / len(ordered) * 1000, 2),
+            'p50_ms': round(pick(0.5), 2), 'p90_ms': round(pick(0.9), 2), 'p99_ms': round(pick(0.99), 2),
+            'max_ms': round(ordered[-1] * 1000, 2)}
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)  # bytes on mac, KB on linux
+
+def _bench_run(label, topics, max_results, workers, server):
+    """One pass over every topic: search, fetch + extract, summarize - timed per call"""
+    timings = {'search': [], 'extract': [], 'summarize': []}
+    store = get_cache_store()
+    cache_before = dict(getattr(store, 'counters', {}))
+    http_before = get_http_client().metrics()
+    server_before = dict(server.stats)
+    counts = {'summary_cache_hits': 0}
+    articles = extracted = 0
+    
+    def timed_extract(url):
+        started = time.perf_counter()
+        text = extract_article_text_multi(url)
+        return time.perf_counter() - started, text
+    
+    started = time.perf_counter()
+    for topic in topics:
+        t0 = time.perf_counter()
+        found = search_news(topic, 7, max_results)
+        timings['search'].append(time.perf_counter() - t0)
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            results = list(pool.map(timed_extract, [a['url'] for a in found]))
+        texts = []
+        for took, text in results:
+            timings['extract'].append(took)
+            if text and len(text) > 300:
+                texts.append(text)
+        articles += len(found)
+        extracted += len(texts)
+        
+        for text in texts:
+            t0 = time.perf_counter()
+            summarize_text(text, stats=counts)
+            timings['summarize'].append(time.perf_counter() - t0)
+    wall = time.perf_counter() - started
+    
+    cache_after = getattr(store, 'counters', {})
+    http_after = get_http_client().metrics()
+    return {
+        'label': label,
+        'wall_s': round(wall, 3),
+        'articles': articles,
+        'extracted': extracted,
+        'articles_per_s': round(articles / wall, 2) if wall else None,
+        'stages': {stage: latency_summary(values) for stage, values in timings.items()},
+        'cache': {k: cache_after.get(k, 0) - cache_before.get(k, 0) for k in ('hits', 'misses', 'writes')},
+        'summary_cache_hits': counts['summary_cache_hits'],
+        'http': {k: http_after.get(k, 0) - http_before.get(k, 0) for k in ('requests', 'responses', 'connections')},
+        'server': {k: server.stats[k] - server_before[k] for k in server.stats},
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+def _print_bench(results, baseline=None):
+    base_runs = {run['label']: run for run in (baseline or {}).get('runs', [])}
+    
+    def delta(new, old):
+        if old in (None, 0) or new is None:
+            return ''
+        return f" ({(new - old) / old * 100:+.0f}%)"
+    
+    for run in results['runs']:
+        old = base_runs.get(run['label'], {})
+        print(f"[bench] {run['label']}: {run['articles']} articles ({run['extracted']} extracted) in {run['wall_s']:.2f}s, "
+              f"{run['articles_per_s']}/s{delta(run['articles_per_s'], old.get('articles_per_s'))}, "
+              f"peak rss {run['peak_rss_mb']} MB")
+        for stage, st in run['stages'].items():
+            if not st['count']:
+                continue
+            old_st = old.get('stages', {}).get(stage, {})
+            print(f"  {stage:10s} n={st['count']:<4d} p50 {st['p50_ms']:8.1f}ms{delta(st['p50_ms'], old_st.get('p50_ms')):8s}"
+                  f" p90 {st['p90_ms']:8.1f}ms{delta(st['p90_ms'], old_st.get('p90_ms')):8s} p99 {st['p99_ms']:8.1f}ms")
+        print(f"  cache {run['cache']['hits']} hits / {run['cache']['misses']} misses, "
+              f"{run['summary_cache_hits']} summaries cached, {run['server']['not_modified']} x 304, "
+              f"{run['server']['errors_injected']} 503s + {run['server']['resets_injected']} resets injected")
+
+def bench_main(argv):
+    """scout-agent.py bench - offline search/extract/summarize benchmark against a local stand-in server"""
+    global RATE_LIMIT_DELAY
+    parser = argparse.ArgumentParser(prog='scout-agent.py bench',
+                                     description='Offline benchmark over the fixture corpus in bench/fixtures')
+    parser.add_argument('--topics', nargs='+', default=None, help='feeds to run (default: every fixture feed)')
+    parser.add_argument('--runs', type=int, default=2, help='passes over the corpus, first one cold (default: 2)')
+    parser.add_argument('--max', type=int, default=15, help='articles per topic')
+    parser.add_argument('--workers', type=int, default=4, help='concurrent fetch + extract')
+    parser.add_argument('--latency', type=float, default=20, help='ms added to every response')
+    parser.add_argument('--jitter', type=float, default=10, help='up to this many extra ms, random')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of requests answered with 503')
+    parser.add_argument('--reset-rate', type=float, default=0.0, help='share of connections dropped')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--summarizer', choices=list(SUMMARIZER_MODELS), default='extractive')
+    parser.add_argument('--out', default=None, help='results json (default: bench/results/bench-<time>.json)')
+    parser.add_argument('--baseline', default=None, help='earlier results json to compare against')
+    args = parser.parse_args(argv)
+    
+    topics = args.topics or sorted(name[:-4].replace('-', ' ') for name in os.listdir(os.path.join(BENCH_FIXTURES, 'feeds'))
+                                   if name.endswith('.xml'))
+    server = BenchServer(latency=args.latency / 1000, jitter=args.jitter / 1000, error_rate=args.error_rate,
+                         reset_rate=args.reset_rate, seed=args.seed).start()
+    workdir = tempfile.mkdtemp(prefix='scout-bench-')
+    old_store = set_cache_store(SqliteCacheStore(os.path.join(workdir, CACHE_DB_NAME)))
+    old_client = set_http_client(HttpClient(host_overrides={host: server.url for host in bench_hosts()}))
+    old_delay, RATE_LIMIT_DELAY = RATE_LIMIT_DELAY, 0
+    set_summarizer_mode(args.summarizer)
+    print(f"[bench] {len(topics)} topics via {server.url}, {args.latency:g}+{args.jitter:g}ms latency, "
+          f"{args.error_rate:.0%} errors, {args.reset_rate:.0%} resets, summarizer {args.summarizer}")
+    
+    results = {
+        'version': 1,
+        'started': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'config': vars(args),
+        'runs': [],
+    }
+    try:
+        for n in range(max(1, args.runs)):
+            results['runs'].append(_bench_run('cold' if n == 0 else f'warm{n}', topics, args.max, args.workers, server))
+    finally:
+        RATE_LIMIT_DELAY = old_delay
+        get_http_client().close()
+        set_http_client(old_client)
+        get_cache_store().close()
+        set_cache_store(old_store)
+        server.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+    results['peak_rss_mb'] = peak_rss_mb()
+    
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    _print_bench(results, baseline)
+    
+    out = args.out or os.path.join(BENCH_RESULTS, f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"[bench] results -> {out}")
+
+def agent_from_args(args, topic, **extra):
+    return ScoutAgent(
+        topic=topic,
+        days_back=args.days,
+        verbose=args.verbose,
+        max_articles=args.max,
+        workers=args.workers,
+        summary_batch_size=args.batch_size,
+        reextract=args.reextract,
+        incremental=args.incremental,
+        pipeline=args.pipeline,
+        queue_depth=args.queue_depth,
+        stage_workers={
+            'fetch': args.fetch_workers,
+            'extract': args.extract_workers,
+            'summarize': args.summarize_workers
+        },
+        **extra
+    )
+
+def read_topics(source):
+    """One topic per line from a file ('-' = stdin), blank lines and # comments skipped, repeats dropped"""
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    topics = [line.strip() for line in lines if line.strip() and not line.strip().startswith('#')]
+    return list(dict.fromkeys(topics))
+
+def topic_slug(topic, taken):
+    slug = re.sub(r'[^a-z0-9]+', '-', topic.lower()).strip('-')[:60] or 'topic'
+    candidate, n = slug, 2
+    while candidate in taken:
+        candidate, n = f"{slug}-{n}", n + 1
+    taken.add(candidate)
+    return candidate
+
+def run_batch(topics, args):
+    """Every topic in this one process: model, http pool and caches load once, shared urls are done once"""
+    if args.pipeline:
+        print("[batch] --pipeline is ignored here, batch mode dedups articles in the threaded path")
+        args.pipeline = False
+    report_dir = args.report_dir or f"scout_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    os.makedirs(report_dir, exist_ok=True)
+    shared = SharedArticles()
+    slugs, rows = set(), []
+    print(f"[batch] {len(topics)} topics -> {report_dir}")
+    
+    started = time.perf_counter()
+    for n, topic in enumerate(topics, 1):
+        print(f"\n[batch] {n}/{len(topics)}: {topic}")
+        report_file = os.path.join(report_dir, topic_slug(topic, slugs) + '.txt')
+        agent = agent_from_args(args, topic, shared=shared, report_file=report_file)
+        topic_started = time.perf_counter()
+        try:
+            with TRACER.span('topic', topic=topic):
+                result = agent.run()
+        except Exception as e:
+            print(f"[batch] {topic} failed: {e}")
+            result = None
+        rows.append({
+            'topic': topic,
+            'ok': bool(result),
+            'seconds': round(time.perf_counter() - topic_started, 2),
+            'found': agent.stats['found'],
+            'extracted': agent.stats['extracted'],
+            'failed': agent.stats['failed'],
+            'report': result['report_file'] if result else None,
+        })
+    wall = time.perf_counter() - started
+    
+    articles = sum(r['found'] for r in rows)
+    summary = {
+        'started': datetime.fromtimestamp(time.time() - wall).isoformat(timespec='seconds'),
+        'wall_s': round(wall, 2),
+        'topics': len(topics),
+        'topics_ok': sum(1 for r in rows if r['ok']),
+        'articles': articles,
+        'unique_urls': shared.stats['fetched'],
+        'articles_per_s': round(articles / wall, 2) if wall else None,
+        'topics_per_min': round(len(topics) / wall * 60, 2) if wall else None,
+        'shared': dict(shared.stats),
+        'http': get_http_client().metrics(),
+        'per_topic': rows,
+    }
+    with open(os.path.join(report_dir, 'batch_summary.json'), 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    
+    print("\n" + "=" * 60)
+    print(f"Batch complete: {summary['topics_ok']}/{len(topics)} topics in {wall:.1f}s "
+          f"({summary['topics_per_min']} topics/min, {summary['articles_per_s']} articles/s)")
+    print(f"  {articles} articles, {shared.stats['fetched']} unique urls fetched "
+          f"({shared.stats['reused']} reused across topics), "
+          f"{shared.stats['summarized']} summarized ({shared.stats['summaries_reused']} reused)")
+    for r in rows:
+        mark = '✓' if r['ok'] else '✗'
+        print(f"  {mark} {r['topic'][:40]:40s} {r['extracted']:3d}/{r['found']:<3d} {r['seconds']:7.1f}s")
+    print(f"  summary: {os.path.join(report_dir, 'batch_summary.json')}")
+    return summary
+
+# service mode: one warm process, topics come in over http (or a unix socket)
+SERVICE_ADDRESS = '127.0.0.1:8765'
+SERVICE_JOBS = 2  # topics researched at once
+SERVICE_QUEUE = 32  # waiting topics before we answer 503
+SERVICE_RESULT_TTL = 15 * 60  # a finished topic is answered from cache this long
+SERVICE_KEEP_JOBS = 500  # finished jobs kept around for polling
+SERVICE_MAX_WAIT = 600  # longest ?wait= a request may block for, seconds (way under threading.TIMEOUT_MAX)
+
+class ScoutService:
+    """
+    Job queue in front of ScoutAgent: a bounded queue, SERVICE_JOBS worker threads,
+    identical in-flight topics coalesced into one job, and finished results kept
+    in the cache store so a repeat query is answered without running anything.
+    """
+    
+    def __init__(self, args, jobs=SERVICE_JOBS, queue_size=SERVICE_QUEUE, result_ttl=SERVICE_RESULT_TTL,
+                 report_dir=None):
+        self.args = args
+        self.jobs = max(1, jobs)
+        self.result_ttl = result_ttl
+        self.report_dir = report_dir or 'scout_service_reports'
+        self._queue = queue.Queue(maxsize=max(1, queue_size))
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._jobs = OrderedDict()  # id -> job
+        self._inflight = {}  # key -> job
+        self._next_id = 0
+        self._running = 0
+        self.started = time.time()
+        self.stats = {'submitted': 0, 'coalesced': 0, 'cached': 0, 'rejected': 0, 'done': 0, 'failed': 0}
+        self._workers = [threading.Thread(target=self._work, name=f'job-{n}', daemon=True) for n in range(self.jobs)]
+        for worker in self._workers:
+            worker.start()
+    
+    @staticmethod
+    def key(topic, days, max_articles):
+        return f"{days}|{max_articles}|{' '.join(topic.lower().split())}"
+    
+    def _new_job(self, topic, days, max_articles, key):
+        """New job in the map, or None when SERVICE_KEEP_JOBS are all still queued/running"""
+        if len(self._jobs) >= SERVICE_KEEP_JOBS:
+            # oldest finished ones go first, wherever they sit between live ones
+            finished = [job_id for job_id, job in self._jobs.items() if job['status'] not in ('queued', 'running')]
+            for job_id in finished[:len(self._jobs) - SERVICE_KEEP_JOBS + 1]:
+                del self._jobs[job_id]
+            if len(self._jobs) >= SERVICE_KEEP_JOBS:
+                return None
+        self._next_id += 1
+        job = {'id': f"{self._next_id:x}", 'key': key, 'topic': topic, 'days': days, 'max': max_articles,
+               'status': 'queued', 'submitted': time.time(), 'started': None, 'finished': None,
+               'cached': False, 'coalesced': 0, 'result': None, 'error': None}
+        self._jobs[job['id']] = job
+        return job
+    
+    def submit(self, topic, days=None, max_articles=None):
+        """-> (job, http status): 200 answered from cache, 202 queued or coalesced, (None, 503) queue or job map full"""
+        days = int(days or self.args.days)
+        max_articles = int(max_articles or self.args.max)
+        key = self.key(topic, days, max_articles)
+        entry = get_cache_store().get('result', key)
+        with self._lock:
+            self.stats['submitted'] += 1
+            if entry and entry.value:
+                job = self._new_job(topic, days, max_articles, key)
+                if job is None:
+                    self.stats['rejected'] += 1
+                    return None, 503
+                job.update(status='done', cached=True, finished=time.time(), result=json.loads(entry.value))
+                self.stats['cached'] += 1
+                return job, 200
+            job = self._inflight.get(key)
+            if job is not None:
+                job['coalesced'] += 1
+                self.stats['coalesced'] += 1
+                return job, 202
+            job = self._new_job(topic, days, max_articles, key)
+            if job is None:
+                self.stats['rejected'] += 1
+                return None, 503
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self._jobs.pop(job['id'], None)
+                self.stats['rejected'] += 1
+                return None, 503
+            self._inflight[key] = job
+            return job, 202
+    
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def wait(self, job, timeout):
+        """Block until the job is finished or timeout seconds pass"""
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while job['status'] in ('queued', 'running'):
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                self._changed.wait(left)
+        return job
+    
+    def watch(self, job, timeout=600):
+        """Yield the job each time its status changes, ends when it's finished"""
+        deadline = time.monotonic() + timeout
+        last = None
+        with self._changed:
+            while True:
+                if job['status'] != last:
+                    last = job['status']
+                    yield self.view(job)
+                if job['status'] not in ('queued', 'running') or time.monotonic() > deadline:
+                    return
+                self._changed.wait(max(0.0, min(5.0, deadline - time.monotonic())))
+    
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            with self._changed:
+                job['status'], job['started'] = 'running', time.time()
+                self._running += 1
+                self._changed.notify_all()
+            try:
+                report_file = os.path.join(self.report_dir, f"{topic_slug(job['topic'], set())}_{job['id']}.txt")
+                agent = agent_from_args(self.args, job['topic'], report_file=report_file)
+                agent.days_back, agent.max_articles = job['days'], job['max']
+                with TRACER.span('topic', topic=job['topic'], job=job['id']):
+                    result = agent.run()
+                result = json.loads(json.dumps(result, default=str)) if result else None
+                if result:
+                    get_cache_store().put('result', job['key'], json.dumps(result), ttl=self.result_ttl)
+                status, error = ('done', None) if result else ('failed', 'no articles found')
+            except Exception as e:
+                result, status, error = None, 'failed', f"{type(e).__name__}: {e}"
+            with self._changed:
+                job.update(status=status, error=error, result=result, finished=time.time())
+                self._running -= 1
+                self.stats[status] += 1
+                self._inflight.pop(job['key'], None)
+                self._changed.notify_all()
+            self._queue.task_done()
+    
+    @staticmethod
+    def view(job, with_result=True):
+        out = {k: v for k, v in job.items() if k != 'key' and (with_result or k != 'result')}
+        if job['finished'] and job['started']:
+            out['seconds'] = round(job['finished'] - job['started'], 3)
+        return out
+    
+    def health(self):
+        with self._lock:
+            return {'status': 'ok', 'uptime_s': round(time.time() - self.started, 1),
+                    'queued': self._queue.qsize(), 'running': self._running, 'workers': self.jobs,
+                    'queue_limit': self._queue.maxsize, 'model': summarizer_model_name(),
+                    'model_loaded': _SUMMARIZER_LOADED, 'stats': dict(self.stats)}
+
+def service_handler(service):
+    import http.server
+    
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        
+        def _send(self, status, payload):
+            body = json.dumps(payload, default=str).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def _params(self):
+            """(path, params from query + body), or (None, None) after a 400 for a bad Content-Length"""
+            parsed = urlparse(self.path)
+            params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+            try:
+                length = int(self.headers.get('Content-Length') or 0)
+                if length < 0:
+                    raise ValueError(length)
+            except ValueError:
+                self.close_connection = True  # body length unknown, can't read past it
+                self._send(400, {'error': 'bad Content-Length'})
+                return None, None
+            if length:
+                raw = self.rfile.read(length).decode('utf-8', errors='replace')
+                try:
+                    params.update(json.loads(raw) if raw.lstrip().startswith('{') else
+                                  {k: v[0] for k, v in parse_qs(raw).items()})
+                except ValueError:
+                    pass
+            return parsed.path.rstrip('/') or '/', params
+        
+        def _numbers(self, params, **wanted):
+            """wanted: name=(type, minimum, maximum or None). {name: value or None}, or None after a 400 for a bad one"""
+            out = {}
+            for name, (kind, minimum, maximum) in wanted.items():
+                raw = params.get(name)
+                if raw is None or raw == '':
+                    out[name] = None
+                    continue
+                try:
+                    value = kind(raw)
+                    if not math.isfinite(value) or value < minimum or (maximum is not None and value > maximum):
+                        raise ValueError(raw)
+                except (TypeError, ValueError):
+                    limits = f">= {minimum}" if maximum is None else f"between {minimum} and {maximum}"
+                    self._send(400, {'error': f"{name} must be a number {limits}"})
+                    return None
+                out[name] = value
+            return out
+        
+        def _submit(self, params):
+            topic = str(params.get('topic') or '').strip()
+            if not topic:
+                return self._send(400, {'error': 'topic is required'})
+            # all checked before anything is queued
+            numbers = self._numbers(params, days=(int, 1, None), max=(int, 1, None), wait=(float, 0, SERVICE_MAX_WAIT))
+            if numbers is None:
+                return
+            job, status = service.submit(topic, numbers['days'], numbers['max'])
+            if job is None:
+                return self._send(503, {'error': 'busy (queue or job list full), try again later'})
+            if numbers['wait']:
+                service.wait(job, numbers['wait'])
+                status = 200 if job['status'] in ('done', 'failed') else 202
+            self._send(status, service.view(job))
+        
+        def do_GET(self):
+            path, params = self._params()
+            if path is None:
+                return
+            if path == '/health':
+                return self._send(200, service.health())
+            if path == '/search':
+                params.setdefault('wait', '300')
+                return self._submit(params)
+            if path == '/jobs':
+                numbers = self._numbers(params, limit=(int, 0, None))
+                if numbers is None:
+                    return
+                with service._lock:
+                    jobs = [service.view(j, with_result=False) for j in reversed(service._jobs.values())]
+                limit = 50 if numbers['limit'] is None else numbers['limit']
+                return self._send(200, {'jobs': jobs[:limit]})
+            parts = path.strip('/').split('/')
+            if len(parts) >= 2 and parts[0] == 'jobs':
+                job = service.get(parts[1])
+                if job is None:
+                    return self._send(404, {'error': 'no such job'})
+                if len(parts) == 3 and parts[2] == 'events':
+                    return self._stream(job)
+                numbers = self._numbers(params, wait=(float, 0, SERVICE_MAX_WAIT))
+                if numbers is None:
+                    return
+                if numbers['wait']:
+                    service.wait(job, numbers['wait'])
+                return self._send(200, service.view(job))
+            self._send(404, {'error': 'not found'})
+        
+        def do_POST(self):
+            path, params = self._params()
+            if path is None:
+                return
+            if path in ('/jobs', '/search'):
+                return self._submit(params)
+            self._send(404, {'error': 'not found'})
+        
+        def _stream(self, job):
+            # json lines, one per status change, connection closes when the job is finished
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-ndjson')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            self.close_connection = True
+            try:
+                for view in service.watch(job):
+                    self.wfile.write((json.dumps(view, default=str) + '\n').encode('utf-8'))
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+        
+        def log_message(self, fmt, *args):
+            if service.args.verbose:
+                print(f"[serve] {fmt % args}")
+    
+    return Handler
+
+def run_service(args):
+    """--serve: keep the model, http pool and caches warm, research topics on request"""
+    import http.server
+    import socketserver
+    
+    address = args.serve
+    if address.startswith('unix:'):
+        path = address[5:]
+        if os.path.exists(path):
+            os.unlink(path)
+        
+        class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+            
+            def get_request(self):
+                conn, _ = super().get_request()
+                return conn, ('local', 0)  # the handler wants a (host, port)
+        
+        server_class, server_address = UnixHTTPServer, path
+    else:
+        host, _, port = address.rpartition(':')
+        server_class, server_address = http.server.ThreadingHTTPServer, (host or '127.0.0.1', int(port))
+    
+    # warm up before taking requests - the whole point is not paying for this per query
+    started = time.perf_counter()
+    get_summarizer()
+    get_http_client()
+    get_cache_store()
+    print(f"[serve] warm in {time.perf_counter() - started:.1f}s ({summarizer_model_name()})")
+    
+    service = ScoutService(args, jobs=args.serve_jobs, queue_size=args.serve_queue, report_dir=args.report_dir)
+    os.makedirs(service.report_dir, exist_ok=True)
+    httpd = server_class(server_address, service_handler(service))
+    httpd.daemon_threads = True
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=httpd.shutdown, daemon=True).start())
+    print(f"[serve] listening on {address} - {service.jobs} at once, queue {args.serve_queue}")
+    print(f"[serve] POST /jobs topic=... | GET /jobs/<id>[?wait=s] | GET /jobs/<id>/events | GET /search?topic=... | GET /health")
+    print(f"[serve] ?wait= goes up to {SERVICE_MAX_WAIT}s (400 past that), poll again for longer jobs")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        if address.startswith('unix:') and os.path.exists(server_address):
+            os.unlink(server_address)
+        print("[serve] stopped")
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'cache':
+        cache_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'extract-bench':
+        extract_bench_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'summarizer-bench':
+        summarizer_bench_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        bench_main(sys.argv[2:])
+        return
+    
     parser = argparse.ArgumentParser(
         description='ScoutAgent v1.5 - Automated news research (now with more hacks!)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -963,22 +4659,116 @@ Examples:
   %(prog)s "quantum computing breakthroughs"
   %(prog)s "AI ethics policy" --days 14 --verbose
   %(prog)s "renewable energy" --max 20
+  %(prog)s "chip export rules" --workers 6
+  %(prog)s "grid storage" --pipeline --fetch-workers 6 --queue-depth 4
+  %(prog)s --batch topics.txt --workers 4
+  %(prog)s "grid storage" --incremental   (hourly cron: only new articles cost anything)
+  %(prog)s "grid storage" --jsonl - | my-indexer   (one json line per article as it's done)
+  %(prog)s --serve 127.0.0.1:8765 --serve-jobs 2
   
 Tips:
   • Use specific phrases in quotes
   • Add --verbose to see what's failing
-  • Check .scout_cache_v2 for cached content
+  • %(prog)s cache stats|prune to inspect or trim .scout_cache_v2
   • Some sites will always fail (paywalls)
         """
     )
     
-    parser.add_argument('topic', help='Research topic (use quotes for phrases)')
+    parser.add_argument('topic', nargs='?', help='Research topic (use quotes for phrases)')
+    parser.add_argument('--batch', metavar='FILE', default=None,
+                        help="Run every topic in FILE (one per line, '-' = stdin) in this one process")
+    parser.add_argument('--report-dir', default=None,
+                        help='Batch/serve: where the per-topic reports go (default: scout_batch_<time>, scout_service_reports)')
+    parser.add_argument('--serve', nargs='?', const=SERVICE_ADDRESS, default=None, metavar='ADDR',
+                        help=f'Stay up and take topics over http on host:port or unix:/path.sock (default: {SERVICE_ADDRESS})')
+    parser.add_argument('--serve-jobs', type=int, default=SERVICE_JOBS,
+                        help=f'Serve: topics researched at once (default: {SERVICE_JOBS})')
+    parser.add_argument('--serve-queue', type=int, default=SERVICE_QUEUE,
+                        help=f'Serve: waiting topics before new ones get a 503 (default: {SERVICE_QUEUE})')
     parser.add_argument('--days', type=int, default=7, help='Days back to search (default: 7)')
     parser.add_argument('--max', type=int, default=12, help='Max articles to process (default: 12)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Detailed debug output')
     parser.add_argument('--nocache', action='store_true', help='Disable cache (not recommended)')
+    parser.add_argument('--no-summary-cache', action='store_true',
+                        help='Always rerun the summarizer, even for text it has seen before')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Fetch articles concurrently with N threads (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--pool-size', type=int, default=HTTP_POOL_SIZE,
+                        help=f'Keep-alive connections per host (default: {HTTP_POOL_SIZE})')
+    parser.add_argument('--summarizer', choices=list(SUMMARIZER_MODELS), default=SUMMARIZER_MODE,
+                        help=f'Summary engine, ML models load lazily (default: {SUMMARIZER_MODE})')
+    parser.add_argument('--backend', choices=SUMMARIZER_BACKENDS, default=SUMMARIZER_BACKEND,
+                        help='How the model runs on cpu: torch fp32, dynamic int8, or onnx runtime (exported once, cached)')
+    parser.add_argument('--threads', type=int, default=None, help='Intra-op inference threads (default: all cores)')
+    parser.add_argument('--interop-threads', type=int, default=None, help='Inter-op inference threads')
+    parser.add_argument('--no-dedup', action='store_true',
+                        help='Summarize every copy of syndicated stories instead of one per story')
+    parser.add_argument('--no-chunking', action='store_true',
+                        help='Truncate long articles to the model input instead of map-reduce over chunks')
+    parser.add_argument('--batch-size', type=int, default=SUMMARY_BATCH_SIZE,
+                        help=f'Articles per summarizer call (default: {SUMMARY_BATCH_SIZE})')
+    parser.add_argument('--fixed-extractors', action='store_true',
+                        help="Always use the default extractor order, don't learn per domain")
+    parser.add_argument('--extract-processes', nargs='?', const='auto', default=None, metavar='N',
+                        help='Run extractors in a process pool (N processes, default: one per core; '
+                             'extract threads are raised to N so every process gets work)')
+    parser.add_argument('--page-timeout', type=float, default=EXTRACTION_TIMEOUT,
+                        help=f'Process pool: seconds one page may take before its worker is killed '
+                             f'(default: {EXTRACTION_TIMEOUT})')
+    parser.add_argument('--jsonl', metavar='FILE', default=None,
+                        help="Append each article as a json line the moment it's summarized, then the overview "
+                             "('-' = stdout, progress moves to stderr)")
+    parser.add_argument('--metrics', metavar='FILE', default=None,
+                        help='Write timing spans (stages, urls, http, extractors, summarizer) - .jsonl for one span per line')
+    parser.add_argument('--profile', action='store_true',
+                        help='Show where the time went (hot spots by span, slowest urls) at the end')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only fetch/summarize articles new or changed since the last run of this topic, mark them in the report')
+    parser.add_argument('--reextract', action='store_true',
+                        help="Rebuild this topic's article text from cached html, no network")
+    parser.add_argument('--pipeline', action='store_true',
+                        help='Overlap search/fetch/extract/summarize stages with bounded queues')
+    parser.add_argument('--queue-depth', type=int, default=DEFAULT_QUEUE_DEPTH,
+                        help=f'Pipeline: items buffered between stages (default: {DEFAULT_QUEUE_DEPTH})')
+    parser.add_argument('--fetch-workers', type=int, default=None,
+                        help=f"Pipeline: fetch threads (default: {DEFAULT_STAGE_WORKERS['fetch']})")
+    parser.add_argument('--extract-workers', type=int, default=None,
+                        help=f"Pipeline: extract threads (default: {DEFAULT_STAGE_WORKERS['extract']})")
+    parser.add_argument('--summarize-workers', type=int, default=None,
+                        help=f"Pipeline: summarize threads (default: {DEFAULT_STAGE_WORKERS['summarize']})")
     
     args = parser.parse_args()
+    if args.batch:
+        topics = read_topics(args.batch)
+        if not topics:
+            parser.error(f"no topics in {args.batch}")
+    elif not args.topic and not args.serve:
+        parser.error("give a topic (or --batch FILE, or --serve)")
+    if args.jsonl:
+        stream = ResultStream(args.jsonl)
+        if args.jsonl == '-':
+            sys.stdout = sys.stderr  # the chatty progress prints stay out of the json
+        set_result_stream(stream)
+        atexit.register(stream.close)
+    set_summarizer_mode(args.summarizer, args.backend)
+    set_inference_threads(args.threads, args.interop_threads)
+    if args.nocache:
+        set_cache_store(NullCacheStore())
+    
+    global SUMMARY_CACHE_ENABLED, SUMMARY_CHUNKING, ADAPTIVE_EXTRACTORS, DEDUP_ENABLED
+    SUMMARY_CACHE_ENABLED = not (args.nocache or args.no_summary_cache)
+    SUMMARY_CHUNKING = not args.no_chunking
+    DEDUP_ENABLED = not args.no_dedup
+    ADAPTIVE_EXTRACTORS = not args.fixed_extractors
+    set_http_client(HttpClient(pool_size=max(1, args.pool_size)))
+    
+    if args.extract_processes:
+        processes = None if args.extract_processes == 'auto' else int(args.extract_processes)
+        pool = ExtractionPool(processes, timeout=args.page_timeout,
+                              cpu_limit=min(EXTRACTION_CPU_LIMIT, args.page_timeout))
+        set_extraction_pool(pool)
+        atexit.register(pool.close)
+        print(f"[extract] {pool.processes} worker processes, {args.page_timeout:g}s per page")
     
     if not args.nocache:
         setup_cache()
@@ -986,18 +4776,30 @@ Tips:
         print("[info] Cache disabled")
     
     print("ScoutAgent v1.5 - Because sometimes you need 5 fallback methods...")
+    print(f"[startup] ready in {STARTUP_TIMES['module import']:.2f}s")
     print("=" * 60)
     
-    agent = ScoutAgent(
-        topic=args.topic,
-        days_back=args.days,
-        verbose=args.verbose,
-        max_articles=args.max
-    )
+    if args.metrics or args.profile:
+        TRACER.enable()
+    if args.serve:
+        run_service(args)
+        return
+    if args.batch:
+        result = run_batch(topics, args)
+    else:
+        result = agent_from_args(args, args.topic).run()
     
-    result = agent.run()
+    if args.metrics:
+        TRACER.export(args.metrics)
+        print(f"[metrics] {len(TRACER.spans)} spans -> {args.metrics}")
+    if args.profile:
+        print("\nHot spots (self time):")
+        print(format_profile(TRACER.hot_spots()))
     
-    if result:
+    if args.batch:
+        if not result['topics_ok']:
+            sys.exit(1)
+    elif result:
         print("\n" + "="*60)
         print("Research complete!")
         if result['report_file']:
@@ -1010,11 +4812,14 @@ Tips:
         
         print("\nQuick summary:")
         print(f"  {result['overview'][:150]}...")
+        print(f"Startup: {format_startup_times()}")
         
     else:
         print("\n Research failed or no results")
         sys.exit(1)
 
+STARTUP_TIMES['module import'] = time.perf_counter() - _PROCESS_START
+
 if __name__ == "__main__":
     main()
 
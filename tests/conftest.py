@@ -0,0 +1,25 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'scout-agent.py'
+
+
+def load_scout():
+    """scout-agent.py isn't importable by name (dash, and a ```python line on top), exec it as a module"""
+    source = SCRIPT.read_text(encoding='utf-8')
+    if source.startswith('```'):
+        source = source.split('\n', 1)[1]
+    spec = importlib.util.spec_from_loader('scout_agent', loader=None, origin=str(SCRIPT))
+    module = importlib.util.module_from_spec(spec)
+    module.__file__ = str(SCRIPT)
+    sys.modules['scout_agent'] = module
+    exec(compile(source, str(SCRIPT), 'exec'), module.__dict__)
+    return module
+
+
+@pytest.fixture(scope='session')
+def scout():
+    return load_scout()
@@ -0,0 +1,185 @@
+import time
+
+import pytest
+
+
+# summary lengths
+
+def test_summary_lengths_match_the_single_call_formula(scout):
+    for words in (60, 101, 150, 250, 299, 300, 650, 800):
+        expected_max = min(180, int(words * 0.6))
+        assert scout.summary_lengths(words) == (expected_max, max(40, int(expected_max * 0.4)))
+
+
+def test_summary_lengths_long_articles_and_max_len(scout):
+    assert scout.summary_lengths(801) == (150, 60)
+    assert scout.summary_lengths(5000, max_len=100) == (100, 60)
+    assert scout.summary_lengths(101, max_len=50) == (50, 40)
+
+
+def test_summary_lengths_no_rounding_up(scout):
+    # 101 words used to land in the 200-word bucket and get a 120 token cap
+    assert scout.summary_lengths(101)[0] == 60
+
+
+# near-duplicate detection
+
+STORY = ("The national laboratory repeated its ignition experiment and again produced more energy "
+         "than the lasers delivered to the target. Engineers cautioned that a working power plant "
+         "still needs materials that survive years of neutron bombardment. Investors have put more "
+         "than six billion dollars into fusion startups over the past five years. Critics argue that "
+         "timelines promising grid power within a decade have slipped repeatedly since the 1970s. ")
+OTHER = ("Coral larvae were collected during a mass spawning event and settled onto ceramic tiles. "
+         "Water quality improvements upstream helped the transplanted colonies grow faster than "
+         "expected. Tourism operators support the work because healthy reefs bring visitors. "
+         "Underwater speakers playing the sounds of a healthy reef drew more fish to degraded sites. ")
+
+
+def record(title, content, extracted=True):
+    return {'title': title, 'url': 'https://example.invalid/' + title, 'content': content, 'extracted': extracted}
+
+
+def test_shingles_and_jaccard(scout):
+    grams = scout.shingles("one two three four", size=3)
+    assert set(grams) == {'one two three', 'two three four'}
+    assert scout.shingles("too short", size=3) == {'too': 1, 'short': 1}
+    assert scout._jaccard({1, 2}, {2, 3}) == pytest.approx(1 / 3)
+    assert scout._jaccard(set(), set()) == 0.0
+
+
+def test_simhash_is_close_for_near_copies(scout):
+    a = scout.simhash(scout.shingles(STORY * 2))
+    b = scout.simhash(scout.shingles("By Wire Staff. " + STORY * 2 + " Copyright 2025."))
+    c = scout.simhash(scout.shingles(OTHER * 2))
+    assert bin(a ^ b).count('1') <= scout.DEDUP_CANDIDATE_BITS
+    assert bin(a ^ b).count('1') < bin(a ^ c).count('1')
+
+
+def test_headline_words_drop_the_outlet(scout):
+    assert scout.headline_words("Fusion record edges closer - The Daily Planet") == \
+        scout.headline_words("Fusion record edges closer")
+
+
+def test_same_story_on_text_and_on_headlines(scout):
+    original = scout.story_fingerprint(record("Lab fusion record edges closer", STORY * 2))
+    syndicated = scout.story_fingerprint(record("Fusion lab sets a record", "By Wire Staff. " + STORY * 2))
+    unrelated = scout.story_fingerprint(record("Reef restoration speeds up", OTHER * 2))
+    assert scout.same_story(original, syndicated)
+    assert not scout.same_story(original, unrelated)
+
+    # snippet-only records only have the headline to go on
+    a = scout.story_fingerprint(record("Lab fusion record edges closer to power plant - Outlet A", '', False))
+    b = scout.story_fingerprint(record("Lab fusion record edges closer to power plant - Outlet B", '', False))
+    short = scout.story_fingerprint(record("Fusion news - Outlet C", '', False))
+    assert scout.same_story(a, b)
+    assert not scout.same_story(a, short)
+
+
+def test_group_near_duplicates_keeps_first_appearance_order(scout):
+    records = [
+        record("Reef restoration speeds up", OTHER * 2),
+        record("Lab fusion record edges closer", STORY * 2),
+        record("Fusion lab sets a record", "By Wire Staff. " + STORY * 2),
+        record("Something else entirely", "A completely different article about local elections and budgets. " * 10),
+    ]
+    assert scout.group_near_duplicates(records) == [[0], [1, 2], [3]]
+
+
+# service parameter checks
+
+class FakeHandler:
+    def __init__(self, handler_cls):
+        self.sent = []
+        self._numbers = handler_cls._numbers.__get__(self)
+
+    def _send(self, status, payload):
+        self.sent.append((status, payload))
+
+
+@pytest.fixture
+def handler(scout):
+    return FakeHandler(scout.service_handler(None))
+
+
+def test_numbers_parses_and_defaults(handler, scout):
+    got = handler._numbers({'days': '3', 'wait': '1.5'}, days=(int, 1, None), max=(int, 1, None),
+                           wait=(float, 0, scout.SERVICE_MAX_WAIT))
+    assert got == {'days': 3, 'max': None, 'wait': 1.5}
+    assert handler.sent == []
+
+
+@pytest.mark.parametrize('params', [
+    {'days': 'x'},
+    {'days': '0'},
+    {'days': '1.5'},
+    {'wait': 'nan'},
+    {'wait': 'inf'},
+    {'wait': '-1'},
+    {'wait': '1e12'},  # past threading.TIMEOUT_MAX would blow up in Condition.wait
+])
+def test_numbers_rejects_with_400(handler, scout, params):
+    got = handler._numbers(params, days=(int, 1, None), wait=(float, 0, scout.SERVICE_MAX_WAIT))
+    assert got is None
+    assert len(handler.sent) == 1 and handler.sent[0][0] == 400
+
+
+# sqlite cache store
+
+@pytest.fixture
+def store(scout, tmp_path):
+    store = scout.SqliteCacheStore(str(tmp_path / 'cache.sqlite3'))
+    yield store
+    store.close()
+
+
+def test_cache_roundtrip_and_compression(store, scout):
+    big = 'x' * (scout.CACHE_COMPRESS_MIN * 4)
+    store.put('text', 'a', big, meta={'etag': '"1"'})
+    store.put('raw', 'b', b'\x00\x01')
+    entry = store.get('text', 'a')
+    assert entry.value == big and entry.meta == {'etag': '"1"'}
+    assert store.get('raw', 'b').value == b'\x00\x01'
+    assert store.get('text', 'missing') is None
+    assert store.stats()['bytes'] < len(big)
+
+
+def test_cache_ttl_expiry(store):
+    store.put('text', 'k', 'value', ttl=-1)
+    assert store.get('text', 'k') is None
+    assert store.get('text', 'k', include_expired=True).value == 'value'
+    store.touch('text', 'k', ttl=60)
+    assert store.get('text', 'k').value == 'value'
+    assert store.counters['expired'] == 2
+
+
+def test_prune_drops_long_expired_but_keeps_recent_stale(store, scout):
+    store.put('text', 'stale', 'kept for revalidation', ttl=-1)
+    store.put('text', 'dead', 'gone', ttl=-(scout.CACHE_STALE_KEEP + 60))
+    store.put('text', 'fresh', 'kept', ttl=60)
+    assert store.prune() == 1
+    assert store.get('text', 'dead', include_expired=True) is None
+    assert store.get('text', 'stale', include_expired=True) is not None
+
+
+def test_prune_evicts_least_recently_used(store, scout, monkeypatch):
+    monkeypatch.setattr(scout, 'CACHE_ACCESS_RESOLUTION', 0)
+    for key in ('a', 'b', 'c'):
+        store.put('raw', key, bytes(100))
+        time.sleep(0.01)
+    store.get('raw', 'a')  # now b is the oldest
+    removed = store.prune(max_bytes=250)
+    assert removed == 1
+    assert store.get('raw', 'b') is None
+    assert store.get('raw', 'a') is not None and store.get('raw', 'c') is not None
+
+
+def test_hits_only_rewrite_last_access_past_the_resolution(store, scout, monkeypatch):
+    store.put('text', 'k', 'value')
+    last_access = lambda: store._conn().execute("SELECT last_access FROM entries").fetchone()[0]
+    before = last_access()
+    store.get('text', 'k')
+    assert last_access() == before
+    monkeypatch.setattr(scout, 'CACHE_ACCESS_RESOLUTION', 0)
+    time.sleep(0.01)
+    store.get('text', 'k')
+    assert last_access() > before